@@ -28,13 +28,13 @@ CREATE TABLE IF NOT EXISTS athletes (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_athletes_gender ON athletes(gender);
-CREATE INDEX idx_athletes_wa_id ON athletes(world_athletics_id);
-CREATE INDEX idx_athletes_marathon_rank ON athletes(marathon_rank);
-CREATE INDEX idx_athletes_overall_rank ON athletes(overall_rank);
-CREATE INDEX idx_athletes_data_hash ON athletes(data_hash);
-CREATE INDEX idx_athletes_last_seen ON athletes(last_seen_at);
-CREATE INDEX idx_athletes_ranking_source ON athletes(ranking_source);
+CREATE INDEX IF NOT EXISTS idx_athletes_gender ON athletes(gender);
+CREATE INDEX IF NOT EXISTS idx_athletes_wa_id ON athletes(world_athletics_id);
+CREATE INDEX IF NOT EXISTS idx_athletes_marathon_rank ON athletes(marathon_rank);
+CREATE INDEX IF NOT EXISTS idx_athletes_overall_rank ON athletes(overall_rank);
+CREATE INDEX IF NOT EXISTS idx_athletes_data_hash ON athletes(data_hash);
+CREATE INDEX IF NOT EXISTS idx_athletes_last_seen ON athletes(last_seen_at);
+CREATE INDEX IF NOT EXISTS idx_athletes_ranking_source ON athletes(ranking_source);
 
 -- Races table (tracks different marathon events)
 CREATE TABLE IF NOT EXISTS races (
@@ -57,9 +57,9 @@ CREATE TABLE IF NOT EXISTS races (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_races_date ON races(date);
-CREATE INDEX idx_races_is_active ON races(is_active);
-CREATE INDEX idx_races_lock_time ON races(lock_time);
+CREATE INDEX IF NOT EXISTS idx_races_date ON races(date);
+CREATE INDEX IF NOT EXISTS idx_races_is_active ON races(is_active);
+CREATE INDEX IF NOT EXISTS idx_races_lock_time ON races(lock_time);
 
 -- Athlete-Race junction table (links athletes to races they're competing in)
 CREATE TABLE IF NOT EXISTS athlete_races (
@@ -71,8 +71,8 @@ CREATE TABLE IF NOT EXISTS athlete_races (
     UNIQUE(athlete_id, race_id)
 );
 
-CREATE INDEX idx_athlete_races_athlete ON athlete_races(athlete_id);
-CREATE INDEX idx_athlete_races_race ON athlete_races(race_id);
+CREATE INDEX IF NOT EXISTS idx_athlete_races_athlete ON athlete_races(athlete_id);
+CREATE INDEX IF NOT EXISTS idx_athlete_races_race ON athlete_races(race_id);
 
 -- Fantasy NY Marathon Database Schema
 -- Neon Postgres (Serverless PostgreSQL)
@@ -109,8 +109,8 @@ CREATE TABLE IF NOT EXISTS games (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_games_game_id ON games(game_id);
-CREATE INDEX idx_games_active_race_id ON games(active_race_id);
+CREATE INDEX IF NOT EXISTS idx_games_game_id ON games(game_id);
+CREATE INDEX IF NOT EXISTS idx_games_active_race_id ON games(active_race_id);
 
 -- Player rankings table (replacing rankings.json)
 -- ⚠️ DEPRECATED: This table is part of the legacy snake draft system.
@@ -136,8 +136,8 @@ CREATE TABLE IF NOT EXISTS player_rankings (
     UNIQUE(game_id, player_code, gender, athlete_id)
 );
 
-CREATE INDEX idx_rankings_game_player ON player_rankings(game_id, player_code);
-CREATE INDEX idx_rankings_game_id ON player_rankings(game_id);
+CREATE INDEX IF NOT EXISTS idx_rankings_game_player ON player_rankings(game_id, player_code);
+CREATE INDEX IF NOT EXISTS idx_rankings_game_id ON player_rankings(game_id);
 
 -- Draft teams table (replacing teams.json)
 -- ⚠️ DEPRECATED: This table is part of the legacy snake draft system.
@@ -161,8 +161,8 @@ CREATE TABLE IF NOT EXISTS draft_teams (
     UNIQUE(game_id, player_code, athlete_id)
 );
 
-CREATE INDEX idx_teams_game_player ON draft_teams(game_id, player_code);
-CREATE INDEX idx_teams_game_id ON draft_teams(game_id);
+CREATE INDEX IF NOT EXISTS idx_teams_game_player ON draft_teams(game_id, player_code);
+CREATE INDEX IF NOT EXISTS idx_teams_game_id ON draft_teams(game_id);
 
 -- Race results table (replacing results.json)
 CREATE TABLE IF NOT EXISTS race_results (
@@ -198,9 +198,9 @@ CREATE TABLE IF NOT EXISTS race_results (
     UNIQUE(game_id, athlete_id)
 );
 
-CREATE INDEX idx_results_game_id ON race_results(game_id);
+CREATE INDEX IF NOT EXISTS idx_results_game_id ON race_results(game_id);
 CREATE INDEX IF NOT EXISTS idx_results_finish_time_ms ON race_results(game_id, finish_time_ms);
-CREATE INDEX idx_results_athlete_id ON race_results(athlete_id);
+CREATE INDEX IF NOT EXISTS idx_results_athlete_id ON race_results(athlete_id);
 
 -- Athlete progression table (year-by-year season's bests)
 CREATE TABLE IF NOT EXISTS athlete_progression (
@@ -222,9 +222,9 @@ CREATE TABLE IF NOT EXISTS athlete_progression (
     UNIQUE(athlete_id, discipline, season)
 );
 
-CREATE INDEX idx_progression_athlete_id ON athlete_progression(athlete_id);
-CREATE INDEX idx_progression_discipline ON athlete_progression(discipline);
-CREATE INDEX idx_progression_season ON athlete_progression(season);
+CREATE INDEX IF NOT EXISTS idx_progression_athlete_id ON athlete_progression(athlete_id);
+CREATE INDEX IF NOT EXISTS idx_progression_discipline ON athlete_progression(discipline);
+CREATE INDEX IF NOT EXISTS idx_progression_season ON athlete_progression(season);
 
 -- Athlete race results table (detailed race results by year)
 CREATE TABLE IF NOT EXISTS athlete_race_results (
@@ -244,9 +244,9 @@ CREATE TABLE IF NOT EXISTS athlete_race_results (
     UNIQUE(athlete_id, year, competition_date, competition_name, discipline)
 );
 
-CREATE INDEX idx_race_results_athlete_id ON athlete_race_results(athlete_id);
-CREATE INDEX idx_race_results_year ON athlete_race_results(year);
-CREATE INDEX idx_race_results_discipline ON athlete_race_results(discipline);
+CREATE INDEX IF NOT EXISTS idx_race_results_athlete_id ON athlete_race_results(athlete_id);
+CREATE INDEX IF NOT EXISTS idx_race_results_year ON athlete_race_results(year);
+CREATE INDEX IF NOT EXISTS idx_race_results_discipline ON athlete_race_results(discipline);
 
 -- User accounts table (for future authentication - not implemented yet)
 -- Placeholder for future feature
@@ -262,8 +262,8 @@ CREATE TABLE IF NOT EXISTS users (
     is_active BOOLEAN DEFAULT TRUE
 );
 
-CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_users_username ON users(username);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 
 -- User game associations table (for future feature)
 CREATE TABLE IF NOT EXISTS user_games (
@@ -276,8 +276,8 @@ CREATE TABLE IF NOT EXISTS user_games (
     UNIQUE(user_id, game_id)
 );
 
-CREATE INDEX idx_user_games_user_id ON user_games(user_id);
-CREATE INDEX idx_user_games_game_id ON user_games(game_id);
+CREATE INDEX IF NOT EXISTS idx_user_games_user_id ON user_games(user_id);
+CREATE INDEX IF NOT EXISTS idx_user_games_game_id ON user_games(game_id);
 
 -- Function to update timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -289,23 +289,23 @@ END;
 $$ language 'plpgsql';
 
 -- Triggers for automatic timestamp updates
-CREATE TRIGGER update_athletes_updated_at BEFORE UPDATE ON athletes
+CREATE OR REPLACE TRIGGER update_athletes_updated_at BEFORE UPDATE ON athletes
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_games_updated_at BEFORE UPDATE ON games
+CREATE OR REPLACE TRIGGER update_games_updated_at BEFORE UPDATE ON games
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_results_updated_at BEFORE UPDATE ON race_results
+CREATE OR REPLACE TRIGGER update_results_updated_at BEFORE UPDATE ON race_results
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_athlete_progression_updated_at BEFORE UPDATE ON athlete_progression
+CREATE OR REPLACE TRIGGER update_athlete_progression_updated_at BEFORE UPDATE ON athlete_progression
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_athlete_race_results_updated_at BEFORE UPDATE ON athlete_race_results
+CREATE OR REPLACE TRIGGER update_athlete_race_results_updated_at BEFORE UPDATE ON athlete_race_results
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
+CREATE OR REPLACE TRIGGER update_users_updated_at BEFORE UPDATE ON users
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_races_updated_at BEFORE UPDATE ON races
+CREATE OR REPLACE TRIGGER update_races_updated_at BEFORE UPDATE ON races
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
@@ -8,26 +8,31 @@ athletes that were added before this feature existed.
 
 The script:
 1. Fetches all athletes from the database
-2. Iterates through each athlete slowly (with delays to be polite)
+2. Fetches several athletes concurrently (rate-limited to be polite)
 3. Fetches progression and 2025 race results from their World Athletics profile
-4. Saves the data to athlete_progression and athlete_race_results tables
+4. Saves the data to athlete_progression and athlete_race_results tables on a
+   background writer thread while the next fetches continue
 
 Usage:
     python3 scripts/backfill_athlete_progression.py [--dry-run] [--limit N] [--start-from ID]
     
 Options:
-    --dry-run       Show what would be fetched without saving to database
-    --limit N       Only process N athletes (for testing)
-    --start-from ID Start from a specific athlete database ID (for resuming)
-    --delay N       Delay between athletes in seconds (default: 5)
+    --dry-run         Show what would be fetched without saving to database
+    --limit N         Only process N athletes (for testing)
+    --start-from ID   Start from a specific athlete database ID (for resuming)
+    --delay N         Minimum seconds between starting athlete fetches (default: 5)
+    --concurrency N   Maximum athletes fetched at once (default: 4)
+    --verbose         Print per-athlete details instead of a progress bar
+    --no-overwrite    Keep existing records; only insert new ones
 """
 
 import os
 import sys
-import time
+import asyncio
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Add parent directory to path to import from extract_athlete_progression
 sys.path.insert(0, str(Path(__file__).parent))
@@ -40,11 +45,28 @@ except ImportError:
     print("Error: psycopg2 not installed. Run: pip install psycopg2-binary")
     sys.exit(1)
 
+try:
+    import aiohttp  # noqa: F401 - required by the async fetch helpers
+except ImportError:
+    print("Error: aiohttp not installed. Run: pip install aiohttp")
+    sys.exit(1)
+
+# Optional: single-line progress bar (falls back to periodic progress lines)
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
 # Import functions from extract_athlete_progression
 try:
     from extract_athlete_progression import (
-        fetch_and_save_progression_data,
-        load_env_file
+        DEFAULT_FETCH_DELAY,
+        AsyncRateLimiter,
+        create_async_session,
+        fetch_and_save_progression_data_async,
+        load_env_file,
+        save_progression_data
     )
 except ImportError as e:
     print(f"Error importing from extract_athlete_progression: {e}")
@@ -60,7 +82,11 @@ if not DATABASE_URL:
     print("Create a .env file in the project root with: DATABASE_URL=postgresql://...")
     sys.exit(1)
 
-DEFAULT_DELAY = 5  # Seconds between athlete fetches
+DEFAULT_DELAY = DEFAULT_FETCH_DELAY  # Minimum seconds between starting athlete fetches
+DEFAULT_CONCURRENCY = 4  # Maximum athletes in flight at once
+SAVE_QUEUE_SIZE = 4  # Fetched athletes waiting for the database writer
+ATHLETE_FETCH_BATCH_SIZE = 500  # Rows per round trip when streaming athletes
+PROGRESS_INTERVAL = 25  # Athletes between progress lines without tqdm
 
 
 def get_db_connection():
@@ -68,85 +94,123 @@ def get_db_connection():
     return psycopg2.connect(DATABASE_URL)
 
 
-def fetch_all_athletes(conn, start_from_id: Optional[int] = None) -> List[Dict]:
+def _athlete_filter(
+    start_from_id: Optional[int] = None,
+    skip_existing: bool = False
+) -> Tuple[str, List]:
+    """Build the WHERE clause and parameters selecting athletes to backfill."""
+    conditions = ["a.world_athletics_id IS NOT NULL"]
+    params = []
+    
+    if start_from_id:
+        conditions.append("a.id >= %s")
+        params.append(start_from_id)
+    
+    if skip_existing:
+        conditions.append("NOT EXISTS (SELECT 1 FROM athlete_progression p WHERE p.athlete_id = a.id)")
+        conditions.append("NOT EXISTS (SELECT 1 FROM athlete_race_results r WHERE r.athlete_id = a.id)")
+    
+    return ' AND '.join(conditions), params
+
+
+def count_athletes(
+    conn,
+    start_from_id: Optional[int] = None,
+    skip_existing: bool = False
+) -> int:
     """
-    Fetch all athletes from database that have a World Athletics ID.
+    Count athletes that fetch_all_athletes() would return without a limit.
     
     Args:
         conn: Database connection
         start_from_id: Optional athlete ID to start from (for resuming)
+        skip_existing: If True, exclude athletes that already have data
         
     Returns:
-        List of athlete dictionaries with id, name, world_athletics_id
+        Number of matching athletes
     """
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        if start_from_id:
-            cur.execute("""
-                SELECT id, name, world_athletics_id, gender, country
-                FROM athletes
-                WHERE world_athletics_id IS NOT NULL
-                  AND id >= %s
-                ORDER BY id
-            """, (start_from_id,))
-        else:
-            cur.execute("""
-                SELECT id, name, world_athletics_id, gender, country
-                FROM athletes
-                WHERE world_athletics_id IS NOT NULL
-                ORDER BY id
-            """)
-        
-        return [dict(row) for row in cur.fetchall()]
+    where, params = _athlete_filter(start_from_id, skip_existing)
+    
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT COUNT(*) FROM athletes a WHERE {where}", params)
+        return cur.fetchone()[0]
 
 
-def check_existing_data(conn, athlete_db_id: int) -> Dict[str, int]:
+def fetch_all_athletes(
+    conn,
+    start_from_id: Optional[int] = None,
+    skip_existing: bool = False,
+    limit: Optional[int] = None
+) -> Iterator[Dict]:
     """
-    Check how much progression and race result data already exists for an athlete.
+    Stream athletes from database that have a World Athletics ID.
+    
+    Rows are read through a server-side cursor in batches of
+    ATHLETE_FETCH_BATCH_SIZE rather than loaded all at once. The cursor
+    lives in the connection's open transaction, so pass a connection that
+    nothing else commits or rolls back on while iterating.
     
     Args:
-        conn: Database connection
-        athlete_db_id: Database ID of the athlete
+        conn: Database connection dedicated to this read
+        start_from_id: Optional athlete ID to start from (for resuming)
+        skip_existing: If True, exclude athletes that already have
+            progression or race result data (filtered in SQL)
+        limit: Optional maximum number of athletes to return
         
-    Returns:
-        Dict with counts of existing progression and race_results
+    Yields:
+        Athlete dictionaries with id, name, world_athletics_id
     """
-    with conn.cursor() as cur:
-        # Count progression records
-        cur.execute("""
-            SELECT COUNT(*) FROM athlete_progression WHERE athlete_id = %s
-        """, (athlete_db_id,))
-        progression_count = cur.fetchone()[0]
-        
-        # Count race results
-        cur.execute("""
-            SELECT COUNT(*) FROM athlete_race_results WHERE athlete_id = %s
-        """, (athlete_db_id,))
-        results_count = cur.fetchone()[0]
+    where, params = _athlete_filter(start_from_id, skip_existing)
+    
+    with conn.cursor(name='athletes_stream', cursor_factory=RealDictCursor) as cur:
+        cur.itersize = ATHLETE_FETCH_BATCH_SIZE
+        cur.execute(f"""
+            SELECT a.id, a.name, a.world_athletics_id, a.gender, a.country
+            FROM athletes a
+            WHERE {where}
+            ORDER BY a.id
+            LIMIT %s
+        """, params + [limit or None])
         
-        return {
-            'progression': progression_count,
-            'race_results': results_count
-        }
+        for row in cur:
+            yield dict(row)
 
 
-def backfill_all_athletes(
+async def backfill_all_athletes(
     limit: Optional[int] = None,
     start_from_id: Optional[int] = None,
     dry_run: bool = False,
     delay: int = DEFAULT_DELAY,
-    skip_existing: bool = False
+    skip_existing: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    verbose: bool = False,
+    overwrite: bool = True
 ):
     """
     Backfill progression data for all athletes in database.
     
+    Athletes are fetched concurrently (up to `concurrency` at once) while a
+    shared rate limiter keeps request starts at least `delay` seconds apart.
+    Fetched data is queued for a single writer thread that saves it over the
+    open connection, so database saves overlap with the next fetches instead
+    of holding a fetch slot. Athletes are streamed over a second, read-only
+    connection, so the writer's commits and rollbacks can't close the cursor
+    and the two never wait on each other's connection lock.
+    
     Args:
         limit: Optional limit on number of athletes to process
         start_from_id: Optional athlete ID to start from
         dry_run: If True, don't save to database
-        delay: Seconds to wait between athletes
+        delay: Minimum seconds between starting athlete fetches
         skip_existing: If True, skip athletes that already have data
+        concurrency: Maximum number of athletes fetched at once
+        verbose: If True, print per-athlete details; otherwise show a
+            progress bar (or periodic progress lines) and only errors
+        overwrite: If True, update records that already exist; otherwise
+            keep them and only insert new ones (decided by ON CONFLICT)
     """
     conn = get_db_connection()
+    read_conn = None
     
     try:
         # Fetch all athletes
@@ -155,89 +219,176 @@ def backfill_all_athletes(
         print("=" * 80)
         print(f"Mode: {'DRY RUN' if dry_run else 'LIVE UPDATE'}")
         print(f"Delay: {delay} seconds between athletes")
+        print(f"Concurrency: {concurrency} athletes at once")
         if skip_existing:
             print("Skip Strategy: Athletes with existing data will be skipped")
+        if not overwrite:
+            print("Existing records: kept (only new records inserted)")
         if limit:
             print(f"Limit: Processing only {limit} athletes")
         if start_from_id:
             print(f"Starting from: Athlete DB ID {start_from_id}")
         print("=" * 80)
         
-        athletes = fetch_all_athletes(conn, start_from_id)
-        total_count = len(athletes)
+        total_count = count_athletes(conn, start_from_id, skip_existing=skip_existing)
+        process_count = min(total_count, limit) if limit else total_count
         
-        if limit:
-            athletes = athletes[:limit]
-        
-        print(f"\nFound {total_count} athletes with World Athletics IDs")
-        print(f"Processing {len(athletes)} athletes\n")
+        if skip_existing:
+            print(f"\nFound {total_count} athletes with World Athletics IDs and no existing data")
+        else:
+            print(f"\nFound {total_count} athletes with World Athletics IDs")
+        print(f"Processing {process_count} athletes\n")
         
         # Statistics
         stats = {
             'processed': 0,
-            'skipped': 0,
             'successful': 0,
             'failed': 0,
             'total_progression': 0,
             'total_results': 0
         }
         
-        # Process each athlete
-        for i, athlete in enumerate(athletes, 1):
+        # Per-athlete output: full details when verbose, otherwise one
+        # updating progress bar with errors written above it
+        pbar = tqdm(total=process_count, unit='athl') if TQDM_AVAILABLE and not verbose else None
+        log = pbar.write if pbar else print
+        
+        def record_progress():
+            if pbar:
+                pbar.update(1)
+                pbar.set_postfix(ok=stats['successful'], fail=stats['failed'], prog=stats['total_progression'])
+            elif not verbose and (stats['processed'] % PROGRESS_INTERVAL == 0 or stats['processed'] == process_count):
+                print(f"  Progress: {stats['processed']}/{process_count} athletes ({stats['successful']} ok, {stats['failed']} failed)")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = AsyncRateLimiter(delay)
+        save_queue = asyncio.Queue(maxsize=SAVE_QUEUE_SIZE)
+        
+        async def process_athlete(session, i: int, athlete: Dict):
             athlete_id = athlete['world_athletics_id']
             athlete_db_id = athlete['id']
             name = athlete['name']
             
-            print(f"\n[{i}/{len(athletes)}] Processing {name} (ID: {athlete_id}, DB_ID: {athlete_db_id})")
+            # Be polite - space out requests across all concurrent workers
+            await rate_limiter.wait()
             
-            # Check existing data
-            existing = check_existing_data(conn, athlete_db_id)
-            
-            if skip_existing and (existing['progression'] > 0 or existing['race_results'] > 0):
-                print(f"  ⏭️  Skipping - already has {existing['progression']} progression records and {existing['race_results']} race results")
-                stats['skipped'] += 1
-                continue
-            
-            if existing['progression'] > 0 or existing['race_results'] > 0:
-                print(f"  ℹ️  Athlete already has {existing['progression']} progression records and {existing['race_results']} race results (will update)")
+            if verbose:
+                print(f"\n[{i}/{process_count}] Processing {name} (ID: {athlete_id}, DB_ID: {athlete_db_id})")
             
             try:
-                # Fetch and save progression data
-                progression, race_results, prog_saved, results_saved = fetch_and_save_progression_data(
+                # Fetch progression data; saving happens in save_worker()
+                progression, race_results, _, _ = await fetch_and_save_progression_data_async(
+                    session,
                     athlete_id=athlete_id,
                     athlete_db_id=athlete_db_id,
                     disciplines_filter=["Marathon", "Half Marathon"],  # Focus on marathon events
-                    save_to_db=not dry_run
+                    save_to_db=False,
+                    verbose=verbose
                 )
+            except Exception as e:
+                log(f"  ❌ Error processing athlete {name}: {e}")
+                stats['failed'] += 1
+                stats['processed'] += 1
+                record_progress()
+                return
+            
+            if dry_run:
+                if verbose:
+                    print(f"  🔍 DRY RUN - {name}: would save {len(progression)} progression events and {len(race_results)} race results")
+                stats['processed'] += 1
+                stats['successful'] += 1
+                record_progress()
+            else:
+                # Blocks only when the writer falls behind
+                await save_queue.put((athlete_db_id, progression, race_results))
+        
+        async def save_worker(db_executor: ThreadPoolExecutor):
+            loop = asyncio.get_running_loop()
+            
+            def save(athlete_db_id, progression, race_results):
+                # Existing rows are updated or kept by the INSERT's ON CONFLICT
+                # clause, so no per-athlete existence check is needed. Errors
+                # are raised so they count as failures, not successes.
+                return save_progression_data(
+                    athlete_db_id, progression, race_results,
+                    conn=conn,
+                    verbose=verbose,
+                    on_conflict='update' if overwrite else 'ignore',
+                    raise_errors=True
+                )
+            
+            def save_with_reconnect(athlete_db_id, progression, race_results):
+                nonlocal conn
+                try:
+                    return save(athlete_db_id, progression, race_results)
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    # The long-lived writer connection dropped; reconnect and
+                    # retry this athlete once
+                    log("  🔌 Database connection lost - reconnecting")
+                    try:
+                        conn.close()
+                    except psycopg2.Error:
+                        pass
+                    conn = get_db_connection()
+                    return save(athlete_db_id, progression, race_results)
+            
+            while True:
+                item = await save_queue.get()
+                if item is None:
+                    break
                 
+                athlete_db_id, progression, race_results = item
                 stats['processed'] += 1
+                try:
+                    prog_saved, results_saved = await loop.run_in_executor(
+                        db_executor, save_with_reconnect, athlete_db_id, progression, race_results
+                    )
+                except Exception as e:
+                    log(f"  ❌ Error saving athlete {athlete_db_id}: {e}")
+                    stats['failed'] += 1
+                    record_progress()
+                    continue
+                
                 stats['successful'] += 1
                 stats['total_progression'] += prog_saved
                 stats['total_results'] += results_saved
-                
-                if dry_run:
-                    print(f"  🔍 DRY RUN - Would save {len(progression)} progression events and {len(race_results)} race results")
-                
-            except Exception as e:
-                print(f"  ❌ Error processing athlete: {e}")
-                stats['failed'] += 1
-                stats['processed'] += 1
-            
-            # Be polite - delay before next athlete
-            if i < len(athletes):
-                print(f"  ⏳ Waiting {delay} seconds before next athlete...")
-                time.sleep(delay)
+                record_progress()
+        
+        # One writer thread owns the connection while fetches run concurrently
+        # over one shared HTTP connection pool
+        read_conn = get_db_connection()
+        read_conn.set_session(readonly=True)
+        with ThreadPoolExecutor(max_workers=1) as db_executor:
+            writer = asyncio.create_task(save_worker(db_executor))
+            try:
+                async with create_async_session(limit_per_host=concurrency * 2) as session:
+                    tasks = set()
+                    athletes = fetch_all_athletes(read_conn, start_from_id, skip_existing=skip_existing, limit=limit)
+                    for i, athlete in enumerate(athletes, 1):
+                        # Keep at most `concurrency` athletes in flight; the cursor is
+                        # read further only as slots free up
+                        await semaphore.acquire()
+                        task = asyncio.create_task(process_athlete(session, i, athlete))
+                        task.add_done_callback(lambda _: semaphore.release())
+                        task.add_done_callback(tasks.discard)
+                        tasks.add(task)
+                    await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                # Let the writer drain whatever has been fetched
+                await save_queue.put(None)
+                await writer
+                if pbar:
+                    pbar.close()
         
         # Print summary
         print("\n" + "=" * 80)
         print("BACKFILL COMPLETE")
         print("=" * 80)
         print(f"📊 Statistics:")
-        print(f"   Total athletes in database: {total_count}")
+        print(f"   Total athletes to backfill: {total_count}")
         print(f"   Athletes processed: {stats['processed']}")
         print(f"   Successful: {stats['successful']}")
         print(f"   Failed: {stats['failed']}")
-        print(f"   Skipped: {stats['skipped']}")
         print(f"   Total progression records saved: {stats['total_progression']}")
         print(f"   Total race results saved: {stats['total_results']}")
         
@@ -245,6 +396,8 @@ def backfill_all_athletes(
             print(f"\n🔍 This was a DRY RUN - no changes were made to the database")
         
     finally:
+        if read_conn is not None:
+            read_conn.close()
         conn.close()
 
 
@@ -268,6 +421,15 @@ Examples:
   
   # Full backfill with 3 second delay
   %(prog)s --delay 3
+  
+  # Fetch up to 8 athletes at once
+  %(prog)s --concurrency 8
+  
+  # Print details for every athlete
+  %(prog)s --verbose
+  
+  # Only add records that aren't in the database yet
+  %(prog)s --no-overwrite
         """
     )
     
@@ -293,7 +455,14 @@ Examples:
         '--delay',
         type=int,
         default=DEFAULT_DELAY,
-        help=f'Delay between athletes in seconds (default: {DEFAULT_DELAY})'
+        help=f'Minimum seconds between starting athlete fetches (default: {DEFAULT_DELAY})'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum athletes fetched at once (default: {DEFAULT_CONCURRENCY})'
     )
     
     parser.add_argument(
@@ -302,16 +471,31 @@ Examples:
         help='Skip athletes that already have progression or race result data'
     )
     
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print per-athlete details instead of a progress bar'
+    )
+    
+    parser.add_argument(
+        '--no-overwrite',
+        action='store_true',
+        help='Keep existing progression and race result records; only insert new ones'
+    )
+    
     args = parser.parse_args()
     
     # Run backfill
-    backfill_all_athletes(
+    asyncio.run(backfill_all_athletes(
         limit=args.limit,
         start_from_id=args.start_from,
         dry_run=args.dry_run,
         delay=args.delay,
-        skip_existing=args.skip_existing
-    )
+        skip_existing=args.skip_existing,
+        concurrency=args.concurrency,
+        verbose=args.verbose,
+        overwrite=not args.no_overwrite
+    ))
 
 
 if __name__ == '__main__':
@@ -11,8 +11,9 @@ Usage:
   python scripts/enrich-missing-wa-ids.py
 
 Options:
-  --dry-run    Show what would be updated without making changes
-  --limit N    Limit to processing N athletes (default: no limit)
+  --dry-run        Show what would be updated without making changes
+  --limit N        Limit to processing N athletes (default: no limit)
+  --concurrency N  Searches in flight at once (default: 4)
 """
 
 import os
@@ -20,6 +21,10 @@ import sys
 import time
 import re
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from urllib.parse import quote_plus
 from difflib import SequenceMatcher
 
@@ -28,20 +33,98 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from lxml import etree, html as lxml_html
     from dotenv import load_dotenv
 except ImportError:
     print("Error: Required packages not found.")
-    print("Please install: pip install requests beautifulsoup4 python-dotenv")
+    print("Please install: pip install requests lxml python-dotenv")
     sys.exit(1)
 
+# Optional: C++ fuzzy matching (falls back to difflib if not installed)
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    from rapidfuzz.utils import default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Optional: on-disk HTTP cache so re-runs don't repeat identical searches
+try:
+    import requests_cache
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
 # World Athletics configuration
 WA_BASE_URL = 'https://worldathletics.org'
 WA_SEARCH_URL = f'{WA_BASE_URL}/athletes/search'
-WA_REQUEST_DELAY_MS = 2000  # 2 seconds between searches
+_SEARCH_URL_TEMPLATE = f'{WA_SEARCH_URL}?q={{}}'
+WA_REQUEST_DELAY_MS = 2000  # 2 seconds between searches (across all workers)
+WA_SEARCH_CONCURRENCY = 4  # Searches in flight at once
+SEARCH_CACHE_EXPIRY = timedelta(days=7)  # How long cached search results stay valid
+SEARCH_MAX_ATTEMPTS = 3  # Tries per search when WA serves a rate-limit page
+SEARCH_MAX_BACKOFF = 30  # Longest wait between those tries (seconds)
+RATE_LIMIT_MARKERS = ('rate limit', 'too many requests', 'quota')
+
+
+def _is_rate_limited(response):
+    """
+    Check for a throttling page served in place of search results.
+    
+    A 429 always counts. The text markers are only checked on other error
+    statuses: any 2xx page, with or without results, can mention "quota"
+    in its inline scripts, and an empty one is a real "no results".
+    """
+    if response.status_code == 429:
+        return True
+    if response.ok:
+        return False
+    text = response.text.lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+# Shared HTTP session: keeps the connection to World Athletics alive between
+# searches and retries rate-limited/transient failures with backoff.
+# With requests-cache installed, responses are also cached on disk.
+if CACHE_AVAILABLE:
+    SESSION = requests_cache.CachedSession(
+        'wa_search_cache',
+        backend='sqlite',
+        use_cache_dir=True,
+        expire_after=SEARCH_CACHE_EXPIRY,
+        allowable_methods=('GET',),
+        filter_fn=lambda response: not _is_rate_limited(response)
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Search result entries carry the athlete ID in a data attribute
+_ATHLETE_XPATH = etree.XPath('//*[@data-athlete-id]')
+
+# Time of the last search sent to World Athletics, shared by all workers
+_last_network_request = None
+_rate_limit_lock = threading.Lock()
+UPDATE_BATCH_SIZE = 50  # Resolved IDs written per UPDATE/commit
 
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL')
@@ -50,6 +133,7 @@ if not DATABASE_URL:
     sys.exit(1)
 
 
+@lru_cache(maxsize=4096)
 def normalize_wa_id(wa_id):
     """Remove leading zeros from World Athletics ID"""
     if not wa_id:
@@ -57,9 +141,102 @@ def normalize_wa_id(wa_id):
     return wa_id.lstrip('0')
 
 
-def calculate_name_similarity(name1, name2):
-    """Calculate similarity between two names (0.0 to 1.0)"""
-    return SequenceMatcher(None, name1.lower(), name2.lower()).ratio()
+@lru_cache(maxsize=4096)
+def _normalize_name(name):
+    """Lowercase a name once per distinct string"""
+    return name.lower()
+
+
+@lru_cache(maxsize=2048)
+def _encode_search_query(name):
+    """URL-encode a name for search, collapsing stray whitespace first"""
+    return quote_plus(' '.join(name.split()))
+
+
+def find_best_name_match(name, candidate_names):
+    """
+    Find the candidate most similar to name
+    Returns: (index, similarity) or (None, 0) if there are no candidates
+    """
+    if not candidate_names:
+        return None, 0
+    
+    if RAPIDFUZZ_AVAILABLE:
+        # Scores every candidate and picks the best in a single C++ call
+        _, score, index = fuzz_process.extractOne(
+            name, candidate_names, scorer=fuzz.ratio, processor=default_process
+        )
+        return index, score / 100.0
+    
+    # difflib fallback: real_quick_ratio() and quick_ratio() are cheap upper
+    # bounds on ratio(), so candidates that can't beat the best so far are
+    # skipped before the full comparison
+    matcher = SequenceMatcher(None, _normalize_name(name))
+    best_index = None
+    best_similarity = 0
+    for index, candidate in enumerate(candidate_names):
+        matcher.set_seq2(_normalize_name(candidate))
+        if matcher.real_quick_ratio() <= best_similarity or matcher.quick_ratio() <= best_similarity:
+            continue
+        similarity = matcher.ratio()
+        if similarity > best_similarity:
+            best_index = index
+            best_similarity = similarity
+    return best_index, best_similarity
+
+
+def _wait_for_request_slot():
+    """Block until WA_REQUEST_DELAY_MS has passed since the last network search"""
+    global _last_network_request
+    
+    # Holding the lock while sleeping queues workers one interval apart
+    with _rate_limit_lock:
+        if _last_network_request is not None:
+            wait = WA_REQUEST_DELAY_MS / 1000.0 - (time.monotonic() - _last_network_request)
+            if wait > 0:
+                time.sleep(wait)
+        _last_network_request = time.monotonic()
+
+
+def fetch_search_page(search_url):
+    """
+    GET a search page, keeping network requests WA_REQUEST_DELAY_MS apart.
+    
+    Safe to call from several worker threads. Responses served from the
+    local cache don't hit World Athletics, so they skip the rate limit.
+    """
+    if CACHE_AVAILABLE:
+        response = SESSION.get(search_url, timeout=30, only_if_cached=True)
+        if response.from_cache:
+            return response
+    
+    _wait_for_request_slot()
+    return SESSION.get(search_url, timeout=30)
+
+
+def _fetch_with_backoff(search_url):
+    """
+    Fetch a search page, backing off while World Athletics is throttling us.
+    
+    HTTP 429/5xx statuses are already retried by the session adapter; this
+    also catches throttle pages served with another error status (e.g. a
+    403 quota page), so they are retried instead of failing the search.
+    """
+    for attempt in range(SEARCH_MAX_ATTEMPTS):
+        response = fetch_search_page(search_url)
+        if not _is_rate_limited(response):
+            return response
+        
+        if attempt + 1 < SEARCH_MAX_ATTEMPTS:
+            # Honor Retry-After (in seconds) when the server sends one
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                wait = min(SEARCH_MAX_BACKOFF, int(retry_after))
+            else:
+                wait = min(SEARCH_MAX_BACKOFF, 1.5 * 2 ** attempt)
+            time.sleep(wait)
+    
+    raise requests.RequestException(f"rate limited by World Athletics after {SEARCH_MAX_ATTEMPTS} attempts")
 
 
 def search_world_athletics(athlete_name, gender):
@@ -70,30 +247,26 @@ def search_world_athletics(athlete_name, gender):
     print(f"  Searching World Athletics for: {athlete_name} ({gender})")
     
     try:
-        # Build search URL
-        search_url = f"{WA_SEARCH_URL}?q={quote_plus(athlete_name)}"
+        # Build search URL (names differing only in spacing share a URL,
+        # and so a cache entry)
+        search_url = _SEARCH_URL_TEMPLATE.format(_encode_search_query(athlete_name))
         
-        # Fetch search results
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        response = requests.get(search_url, headers=headers, timeout=30)
+        # Fetch search results, retrying while rate limited
+        response = _fetch_with_backoff(search_url)
         response.raise_for_status()
         
         # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = lxml_html.fromstring(response.content)
         
         # Find athlete links using data-athlete-id attribute
-        athlete_elements = soup.select('[data-athlete-id]')
+        athlete_elements = _ATHLETE_XPATH(tree)
         
         if not athlete_elements:
-            print(f"    No results found")
+            print(f"    {athlete_name}: no results found")
             return None, 0, None
         
-        # Process each result to find best match
-        best_match = None
-        best_similarity = 0
-        
+        # Collect (athlete_id, name, element) for each result
+        candidates = []
         for elem in athlete_elements:
             # Extract athlete ID from data attribute
             athlete_id = elem.get('data-athlete-id')
@@ -101,71 +274,72 @@ def search_world_athletics(athlete_name, gender):
                 continue
             
             # Get athlete name from the element text
-            result_name = elem.get_text(strip=True)
-            
-            # Calculate similarity
-            similarity = calculate_name_similarity(athlete_name, result_name)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                # Construct profile URL from athlete ID
-                # We need href to construct the full URL
-                href = elem.get('href', '')
-                if href:
-                    profile_url = WA_BASE_URL + href if not href.startswith('http') else href
-                else:
-                    profile_url = f"{WA_BASE_URL}/athletes/{athlete_id}"
-                best_match = (athlete_id, similarity, profile_url)
+            result_name = ' '.join(elem.text_content().split())
+            candidates.append((athlete_id, result_name, elem))
+        
+        # Find the result whose name is most similar to the query
+        best_index, best_similarity = find_best_name_match(
+            athlete_name, [name for _, name, _ in candidates]
+        )
+        
+        best_match = None
+        if best_index is not None:
+            athlete_id, _, elem = candidates[best_index]
+            # Construct profile URL, preferring the result's own link
+            # (only looked up for the best match)
+            href = elem.get('href', '')
+            if href:
+                profile_url = WA_BASE_URL + href if not href.startswith('http') else href
+            else:
+                profile_url = f"{WA_BASE_URL}/athletes/{athlete_id}"
+            best_match = (athlete_id, best_similarity, profile_url)
         
         # Only return matches above 70% similarity threshold
         if best_match and best_similarity > 0.70:
-            print(f"    Found match: ID {best_match[0]} ({best_similarity:.1%} similar)")
+            print(f"    {athlete_name}: found match ID {best_match[0]} ({best_similarity:.1%} similar)")
             return best_match
         else:
-            print(f"    No confident match found (best: {best_similarity:.1%})")
+            print(f"    {athlete_name}: no confident match found (best: {best_similarity:.1%})")
             return None, 0, None
             
-    except requests.RequestException as e:
-        print(f"    Error searching: {e}")
+    except (requests.RequestException, etree.ParserError) as e:
+        print(f"    {athlete_name}: error searching: {e}")
         return None, 0, None
 
 
-def get_athletes_without_wa_id(limit=None):
+def get_db_connection():
+    """Open a database connection from DATABASE_URL"""
+    import psycopg2
+    from urllib.parse import urlparse
+    
+    # Parse DATABASE_URL
+    result = urlparse(DATABASE_URL)
+    
+    return psycopg2.connect(
+        database=result.path[1:],
+        user=result.username,
+        password=result.password,
+        host=result.hostname,
+        port=result.port
+    )
+
+
+def get_athletes_without_wa_id(conn, limit=None):
     """Query database for athletes missing World Athletics IDs"""
     try:
-        import psycopg2
-        from urllib.parse import urlparse
-        
-        # Parse DATABASE_URL
-        result = urlparse(DATABASE_URL)
-        
-        # Connect to database
-        conn = psycopg2.connect(
-            database=result.path[1:],
-            user=result.username,
-            password=result.password,
-            host=result.hostname,
-            port=result.port
-        )
-        
         cursor = conn.cursor()
         
-        # Query for athletes without WA IDs
-        query = """
+        # Query for athletes without WA IDs (LIMIT NULL means no limit)
+        cursor.execute("""
             SELECT id, name, country, gender
             FROM athletes
             WHERE world_athletics_id IS NULL OR world_athletics_id = ''
             ORDER BY id
-        """
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        cursor.execute(query)
+            LIMIT %s
+        """, (limit or None,))
         athletes = cursor.fetchall()
         
         cursor.close()
-        conn.close()
         
         return [
             {
@@ -182,46 +356,77 @@ def get_athletes_without_wa_id(limit=None):
         sys.exit(1)
 
 
-def update_athlete_wa_id(athlete_id, wa_id, dry_run=False):
-    """Update athlete's World Athletics ID in database"""
-    if dry_run:
-        print(f"    [DRY RUN] Would update athlete {athlete_id} with WA ID: {wa_id}")
-        return True
-    
+def _update_athlete_wa_id(conn, wa_id, athlete_id):
+    """Write one athlete's WA ID and commit; returns True on success"""
     try:
-        import psycopg2
-        from urllib.parse import urlparse
-        
-        # Parse DATABASE_URL
-        result = urlparse(DATABASE_URL)
-        
-        # Connect to database
-        conn = psycopg2.connect(
-            database=result.path[1:],
-            user=result.username,
-            password=result.password,
-            host=result.hostname,
-            port=result.port
-        )
-        
         cursor = conn.cursor()
-        
-        # Update athlete
         cursor.execute(
             "UPDATE athletes SET world_athletics_id = %s WHERE id = %s",
             (wa_id, athlete_id)
         )
+        conn.commit()
+        cursor.close()
+        return True
+    except Exception as e:
+        conn.rollback()
+        print(f"    ❌ Error updating athlete {athlete_id} with WA ID {wa_id}: {e}")
+        return False
+
+
+def update_athlete_wa_ids(conn, updates, dry_run=False):
+    """
+    Write a batch of (wa_id, athlete_id) pairs with a single UPDATE and commit.
+    
+    world_athletics_id is unique, so if the batch hits a conflict it is
+    rolled back and retried one row at a time; only the conflicting rows
+    are lost.
+    
+    Returns the number of athletes updated.
+    """
+    if not updates:
+        return 0
+    
+    if dry_run:
+        for wa_id, athlete_id in updates:
+            print(f"    [DRY RUN] Would update athlete {athlete_id} with WA ID: {wa_id}")
+        return len(updates)
+    
+    import psycopg2
+    from psycopg2.extras import execute_values
+    
+    try:
+        cursor = conn.cursor()
+        
+        # Update all athletes in the batch from a VALUES list
+        execute_values(
+            cursor,
+            """
+            UPDATE athletes AS a
+            SET world_athletics_id = d.wa_id
+            FROM (VALUES %s) AS d(wa_id, id)
+            WHERE a.id = d.id
+            """,
+            updates,
+            template="(%s, %s)"
+        )
         
         conn.commit()
         cursor.close()
-        conn.close()
         
-        print(f"    ✅ Updated athlete {athlete_id} with WA ID: {wa_id}")
-        return True
+        print(f"    ✅ Updated {len(updates)} athletes with WA IDs")
+        return len(updates)
+        
+    except psycopg2.IntegrityError as e:
+        conn.rollback()
+        print(f"    ⚠️  WA ID conflict in batch of {len(updates)} ({e.diag.message_primary}) - retrying one at a time")
+        updated = sum(_update_athlete_wa_id(conn, wa_id, athlete_id) for wa_id, athlete_id in updates)
+        print(f"    ✅ Updated {updated} of {len(updates)} athletes with WA IDs")
+        return updated
         
     except Exception as e:
-        print(f"    ❌ Error updating athlete {athlete_id}: {e}")
-        return False
+        conn.rollback()
+        print(f"    ❌ Error updating batch of {len(updates)} athletes: {e}")
+        return 0
 
 
 def main():
@@ -238,6 +443,12 @@ def main():
         type=int,
         help='Limit number of athletes to process'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=WA_SEARCH_CONCURRENCY,
+        help=f'Searches in flight at once (default: {WA_SEARCH_CONCURRENCY})'
+    )
     
     args = parser.parse_args()
     
@@ -250,9 +461,24 @@ def main():
         print("🔍 DRY RUN MODE - No changes will be made")
         print()
     
+    # One connection for the whole run instead of one per athlete
+    try:
+        conn = get_db_connection()
+    except Exception as e:
+        print(f"Database error: {e}")
+        sys.exit(1)
+    
+    try:
+        run_enrichment(conn, args)
+    finally:
+        conn.close()
+
+
+def run_enrichment(conn, args):
+    """Search for and store missing World Athletics IDs using an open connection"""
     # Get athletes without WA IDs
     print("📖 Querying database for athletes without WA IDs...")
-    athletes = get_athletes_without_wa_id(limit=args.limit)
+    athletes = get_athletes_without_wa_id(conn, limit=args.limit)
     print(f"   Found {len(athletes)} athletes without WA IDs")
     print()
     
@@ -268,35 +494,49 @@ def main():
     not_found_count = 0
     updated_count = 0
     error_count = 0
+    pending_updates = []  # (wa_id, athlete_id) pairs awaiting a batch UPDATE
     
-    for i, athlete in enumerate(athletes, 1):
-        print(f"[{i}/{len(athletes)}] {athlete['name']} ({athlete['gender']}, {athlete['country']})")
-        
-        # Search World Athletics
-        wa_id, similarity, profile_url = search_world_athletics(
-            athlete['name'],
-            athlete['gender']
+    def flush_updates():
+        nonlocal updated_count, error_count
+        updated = update_athlete_wa_ids(conn, pending_updates, dry_run=args.dry_run)
+        updated_count += updated
+        error_count += len(pending_updates) - updated
+        pending_updates.clear()
+    
+    # Searches run on a small worker pool; the shared rate limit in
+    # fetch_search_page keeps requests to World Athletics spaced out.
+    # Results are consumed in order so output and batching stay sequential.
+    executor = ThreadPoolExecutor(max_workers=max(1, args.concurrency))
+    try:
+        results = executor.map(
+            lambda athlete: search_world_athletics(athlete['name'], athlete['gender']),
+            athletes
         )
         
-        if wa_id:
-            found_count += 1
+        for i, (athlete, result) in enumerate(zip(athletes, results), 1):
+            print(f"[{i}/{len(athletes)}] {athlete['name']} ({athlete['gender']}, {athlete['country']})")
+            wa_id, similarity, profile_url = result
             
-            # Normalize ID (remove leading zeros)
-            wa_id = normalize_wa_id(wa_id)
-            
-            # Update database
-            if update_athlete_wa_id(athlete['id'], wa_id, dry_run=args.dry_run):
-                updated_count += 1
+            if wa_id:
+                found_count += 1
+                
+                # Normalize ID (remove leading zeros)
+                wa_id = normalize_wa_id(wa_id)
+                
+                # Queue the update; written in batches of UPDATE_BATCH_SIZE
+                pending_updates.append((wa_id, athlete['id']))
+                if len(pending_updates) >= UPDATE_BATCH_SIZE:
+                    flush_updates()
             else:
-                error_count += 1
-        else:
-            not_found_count += 1
-        
-        # Rate limiting - wait between searches
-        if i < len(athletes):  # Don't wait after last athlete
-            time.sleep(WA_REQUEST_DELAY_MS / 1000.0)
+                not_found_count += 1
+            
+            print()
+    finally:
+        # Don't wait for queued searches on Ctrl+C
+        executor.shutdown(wait=False, cancel_futures=True)
         
-        print()
+        # Write any remaining resolved IDs (also on Ctrl+C)
+        flush_updates()
     
     # Print summary
     print("=" * 70)
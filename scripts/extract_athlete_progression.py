@@ -19,17 +19,31 @@ Usage:
     
     # Filter by discipline
     python3 scripts/extract_athlete_progression.py --athlete-id 14593938 --disciplines "Marathon" "Half Marathon"
+    
+    # Several athletes, fetched concurrently
+    python3 scripts/extract_athlete_progression.py --athlete-id 14593938 14208194
 """
 
 import argparse
+import asyncio
+import io
 import json
 import os
 import re
+import sqlite3
+import string
 import sys
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from collections import defaultdict
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from wa_next_data import read_until_next_data
 
 # Database imports (optional - only needed when saving to DB)
 try:
@@ -41,6 +55,27 @@ except ImportError:
     print("⚠️  psycopg2 not installed. Database features disabled.", file=sys.stderr)
     print("   Install with: pip install psycopg2-binary", file=sys.stderr)
 
+# Faster JSON parsing (optional - falls back to the json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# SIMD JSON parsing (optional - only materializes the sub-tree we read)
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Async HTTP support (optional - only needed for concurrent batch fetching)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 # Load environment variables from .env file if it exists (for local development)
 def load_env_file():
     env_path = Path(__file__).parent.parent / '.env'
@@ -54,39 +89,251 @@ def load_env_file():
 
 load_env_file()
 
+# The <script id="__NEXT_DATA__"> tag holding the page's JSON payload.
+# Pages are kept as raw bytes, so the regex (and the JSON parse) skip decoding.
+_NEXT_DATA_RE = re.compile(rb'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+# Trailing athlete ID of a profile URL (used for the --url output filename)
+_URL_ATHLETE_ID_RE = re.compile(r'(\d+)/?$')
+# Lowercases ASCII and turns spaces into hyphens in one pass (see _slugify)
+_SLUG_TRANS = str.maketrans(string.ascii_uppercase + ' ', string.ascii_lowercase + '-')
+
+# Both accept bytes; orjson's errors subclass json.JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+# Everything the extractors read lives under this node of __NEXT_DATA__
+_COMPETITOR_POINTER = '/props/pageProps/competitor'
+_simdjson_local = threading.local()
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Shared session for synchronous fetches: keeps connections to World Athletics
+# alive between requests and retries rate-limited/transient failures with backoff.
+# The async fetch helpers follow the same HTTP_RETRY policy (see _get_with_retry).
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True
+)
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=HTTP_RETRY
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# On-disk cache of resolved profile URLs (country/name rarely change), so
+# repeat runs skip the extra request get_athlete_url() makes per athlete.
+# Bump ATHLETE_URL_CACHE_VERSION to invalidate entries if the URL format changes.
+ATHLETE_URL_CACHE_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    / 'marathon-majors-league' / 'athlete_urls.sqlite'
+)
+ATHLETE_URL_CACHE_TTL = 30 * 24 * 3600  # 30 days
+ATHLETE_URL_CACHE_VERSION = 1
+DEFAULT_FETCH_DELAY = 5  # Minimum seconds between starting async athlete fetches
+_athlete_url_memo: Dict[str, str] = {}
+NEXT_DATA_MEMO_SIZE = 256
+_next_data_memo: Dict[str, Dict] = {}
+_next_data_memo_lock = threading.Lock()
+
+
+class RaceResult(NamedTuple):
+    """A single race from an athlete's results (see extract_race_results)."""
+    year: Any
+    discipline: str
+    event_id: Any
+    date: str
+    competition: str
+    competition_id: Optional[Any]
+    venue: str
+    country: str
+    place: str
+    mark: str
+    result_score: Optional[Any]
+    category: str
+    race: str
+    wind: Optional[Any]
+    not_legal: bool
+    remark: str
+
+
+def _json_pointer_extract(blob: bytes, pointer: str) -> Any:
+    """
+    Parse a JSON blob and return only the value at a JSON Pointer.
+    
+    With simdjson the document is validated but only the pointed-at sub-tree
+    is turned into Python objects; otherwise the whole blob is parsed and
+    walked. Returns None if the pointer doesn't resolve.
+    """
+    if SIMDJSON_AVAILABLE:
+        # A parser holds one document at a time, so keep one per thread
+        parser = getattr(_simdjson_local, 'parser', None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        try:
+            value = parser.parse(blob).at_pointer(pointer)
+        except (KeyError, IndexError, TypeError):
+            return None
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        return value
+    
+    value = _json_loads(blob)
+    for key in pointer.split('/')[1:]:
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+    return value
+
 
-def extract_next_data(html: str) -> Optional[Dict]:
+def extract_next_data(html: bytes) -> Optional[Dict]:
     """
     Extract the __NEXT_DATA__ JSON blob from the HTML.
     
+    Only the props.pageProps.competitor sub-tree is kept (everything the
+    extract_* functions read); the rest of the blob is skipped.
+    
     Args:
-        html: Raw HTML content from the page
+        html: Raw HTML content from the page (bytes)
         
     Returns:
         Parsed JSON data or None if not found
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Find the script tag with id="__NEXT_DATA__"
-    next_data_script = soup.find('script', {'id': '__NEXT_DATA__'})
+    # Slice the script tag out with a regex rather than building a DOM of
+    # the whole page just to find it
+    match = _NEXT_DATA_RE.search(html)
     
-    if not next_data_script:
+    if not match:
         print("❌ Could not find __NEXT_DATA__ script tag", file=sys.stderr)
         return None
     
     try:
-        data = json.loads(next_data_script.string)
-        return data
-    except json.JSONDecodeError as e:
+        competitor = _json_pointer_extract(match.group(1), _COMPETITOR_POINTER)
+        return {'props': {'pageProps': {'competitor': competitor or {}}}}
+    except ValueError as e:
         print(f"❌ Failed to parse __NEXT_DATA__ JSON: {e}", file=sys.stderr)
         return None
 
 
+def _slugify(value: str) -> str:
+    """Lowercase a name/country and hyphenate its spaces for a profile URL."""
+    if value.isascii():
+        return value.translate(_SLUG_TRANS)
+    # translate() only knows ASCII case; let lower() handle accented letters
+    return value.lower().replace(' ', '-')
+
+
+def build_athlete_url(athlete_id: str, html: bytes) -> Optional[str]:
+    """
+    Construct the full athlete profile URL from a fetched profile page.
+    
+    Args:
+        athlete_id: World Athletics athlete ID
+        html: HTML content of the short-form athlete page (bytes)
+        
+    Returns:
+        Full URL, or None if the page lacks the country/name data
+    """
+    # Extract __NEXT_DATA__ to get athlete details
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    
+    basic = _json_pointer_extract(match.group(1), f'{_COMPETITOR_POINTER}/basicData') or {}
+    
+    # Extract name components
+    # Use countryFullName (e.g., "Kenya") instead of countryCode (e.g., "KEN")
+    country_full = basic.get('countryFullName', '')
+    country = _slugify(country_full) if country_full else basic.get('countryCode', '').lower()
+    given_name = _slugify(basic.get('givenName', ''))
+    family_name = _slugify(basic.get('familyName', ''))
+    
+    if country and family_name:
+        # Construct the full URL
+        return f"https://worldathletics.org/athletes/{country}/{given_name}-{family_name}-{athlete_id}"
+    
+    return None
+
+
+def _open_athlete_url_cache() -> sqlite3.Connection:
+    """Open the athlete URL cache database, creating it if needed."""
+    ATHLETE_URL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(ATHLETE_URL_CACHE_PATH, timeout=10)
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS athlete_urls (
+            athlete_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (athlete_id, version)
+        )
+    """)
+    return cache
+
+
+def get_cached_athlete_url(athlete_id: str) -> Optional[str]:
+    """
+    Look up a previously resolved profile URL (in memory, then on disk).
+    
+    Args:
+        athlete_id: World Athletics athlete ID
+        
+    Returns:
+        Cached full URL, or None if missing or older than ATHLETE_URL_CACHE_TTL
+    """
+    if athlete_id in _athlete_url_memo:
+        return _athlete_url_memo[athlete_id]
+    
+    try:
+        cache = _open_athlete_url_cache()
+        try:
+            row = cache.execute(
+                "SELECT url FROM athlete_urls WHERE athlete_id = ? AND version = ? AND fetched_at > ?",
+                (athlete_id, ATHLETE_URL_CACHE_VERSION, time.time() - ATHLETE_URL_CACHE_TTL)
+            ).fetchone()
+        finally:
+            cache.close()
+    except (sqlite3.Error, OSError):
+        return None
+    
+    if row:
+        _athlete_url_memo[athlete_id] = row[0]
+        return row[0]
+    return None
+
+
+def cache_athlete_url(athlete_id: str, url: str) -> None:
+    """Remember a resolved profile URL in memory and on disk (best effort)."""
+    _athlete_url_memo[athlete_id] = url
+    
+    try:
+        cache = _open_athlete_url_cache()
+        try:
+            with cache:
+                cache.execute(
+                    "INSERT OR REPLACE INTO athlete_urls (athlete_id, version, url, fetched_at) VALUES (?, ?, ?, ?)",
+                    (athlete_id, ATHLETE_URL_CACHE_VERSION, url, time.time())
+                )
+        finally:
+            cache.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
 def get_athlete_url(athlete_id: str) -> Optional[str]:
     """
     Get the full athlete profile URL by extracting athlete data.
     
     Fetches the page and constructs the full URL from athlete name and country.
+    Resolved URLs are cached, so repeat lookups don't fetch the page again.
     
     Args:
         athlete_id: World Athletics athlete ID
@@ -94,48 +341,31 @@ def get_athlete_url(athlete_id: str) -> Optional[str]:
     Returns:
         Full URL (e.g., https://worldathletics.org/athletes/kenya/peres-jepchirchir-14593938)
     """
-    search_url = f"https://worldathletics.org/athletes/_/{athlete_id}"
+    cached_url = get_cached_athlete_url(athlete_id)
+    if cached_url:
+        return cached_url
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
+    search_url = f"https://worldathletics.org/athletes/_/{athlete_id}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=30)
-        response.raise_for_status()
+        with SESSION.get(search_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            html = read_until_next_data(response)
         
-        # Extract __NEXT_DATA__ to get athlete details
-        match = re.search(r'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>', response.text)
-        if not match:
-            return search_url  # Fallback to short URL
-        
-        data = json.loads(match.group(1))
-        props = data.get('props', {})
-        page_props = props.get('pageProps', {})
-        competitor = page_props.get('competitor', {})
-        basic = competitor.get('basicData', {})
-        
-        # Extract name components
-        # Use countryFullName (e.g., "Kenya") instead of countryCode (e.g., "KEN")
-        country_full = basic.get('countryFullName', '')
-        country = country_full.lower().replace(' ', '-') if country_full else basic.get('countryCode', '').lower()
-        given_name = basic.get('givenName', '').lower().replace(' ', '-')
-        family_name = basic.get('familyName', '').lower().replace(' ', '-')
-        
-        if country and family_name:
-            # Construct the full URL
-            full_url = f"https://worldathletics.org/athletes/{country}/{given_name}-{family_name}-{athlete_id}"
-            return full_url
+        athlete_url = build_athlete_url(athlete_id, html)
+        if athlete_url:
+            cache_athlete_url(athlete_id, athlete_url)
+            return athlete_url
         
         # Fallback to short URL if we can't construct it
         return search_url
         
-    except (requests.RequestException, json.JSONDecodeError, KeyError) as e:
+    except (requests.RequestException, ValueError, KeyError) as e:
         print(f"⚠️  Could not construct full URL, using short format: {e}", file=sys.stderr)
         return search_url
 
 
-def fetch_athlete_page(athlete_id: str) -> Optional[str]:
+def fetch_athlete_page(athlete_id: str) -> Optional[bytes]:
     """
     Fetch the athlete profile page HTML.
     
@@ -143,27 +373,23 @@ def fetch_athlete_page(athlete_id: str) -> Optional[str]:
         athlete_id: World Athletics athlete ID
         
     Returns:
-        HTML content or None if request failed
+        HTML content (bytes) or None if request failed
     """
     # Get the full URL first (with country and name)
     athlete_url = get_athlete_url(athlete_id)
     if not athlete_url:
         return None
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(athlete_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.text
+        with SESSION.get(athlete_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            return read_until_next_data(response)
     except requests.RequestException as e:
         print(f"❌ Failed to fetch athlete page: {e}", file=sys.stderr)
         return None
 
 
-def fetch_athlete_page_by_url(url: str) -> Optional[str]:
+def fetch_athlete_page_by_url(url: str) -> Optional[bytes]:
     """
     Fetch the athlete profile page HTML by direct URL.
     
@@ -171,21 +397,200 @@ def fetch_athlete_page_by_url(url: str) -> Optional[str]:
         url: Full URL to the athlete profile page
         
     Returns:
-        HTML content or None if request failed
+        HTML content (bytes) or None if request failed
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.text
+        with SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            return read_until_next_data(response)
     except requests.RequestException as e:
         print(f"❌ Failed to fetch athlete page: {e}", file=sys.stderr)
         return None
 
 
+def get_next_data_for_athlete(athlete_id: str) -> Optional[Dict]:
+    """
+    Fetch and parse an athlete's __NEXT_DATA__, reusing earlier results.
+    
+    Parsed pages are memoized for the lifetime of the process, so the
+    extractors can be called repeatedly for the same athlete without
+    refetching. Failed fetches are not memoized.
+    
+    Args:
+        athlete_id: World Athletics athlete ID
+        
+    Returns:
+        Parsed __NEXT_DATA__ or None if the page couldn't be fetched/parsed
+    """
+    next_data = _next_data_memo.get(athlete_id)
+    if next_data is not None:
+        return next_data
+    
+    html = fetch_athlete_page(athlete_id)
+    if not html:
+        return None
+    
+    next_data = extract_next_data(html)
+    if next_data is not None:
+        with _next_data_memo_lock:
+            if len(_next_data_memo) >= NEXT_DATA_MEMO_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _next_data_memo[next(iter(_next_data_memo))]
+            _next_data_memo[athlete_id] = next_data
+    return next_data
+
+
+async def _get_with_retry(session: "aiohttp.ClientSession", url: str) -> bytes:
+    """
+    GET a URL and return its body, retrying like the sync SESSION does.
+    
+    Statuses in HTTP_RETRY.status_forcelist are retried up to HTTP_RETRY.total
+    times, waiting for the Retry-After header when the server sends one and
+    backing off exponentially (1s, 2s, 4s) otherwise.
+    
+    Raises:
+        aiohttp.ClientResponseError: On an error status once retries run out
+    """
+    for attempt in range(HTTP_RETRY.total + 1):
+        async with session.get(url) as response:
+            if response.status not in HTTP_RETRY.status_forcelist or attempt == HTTP_RETRY.total:
+                response.raise_for_status()
+                return await response.read()
+            retry_after = response.headers.get('Retry-After')
+        
+        wait = HTTP_RETRY.backoff_factor * (2 ** attempt)
+        if retry_after:
+            try:
+                wait = HTTP_RETRY.parse_retry_after(retry_after)
+            except Exception:
+                pass  # Unparseable header - keep the backoff
+        await asyncio.sleep(wait)
+
+
+async def get_athlete_url_async(session: "aiohttp.ClientSession", athlete_id: str) -> str:
+    """
+    Async variant of get_athlete_url() for use with a shared aiohttp session.
+    
+    Args:
+        session: Shared aiohttp client session
+        athlete_id: World Athletics athlete ID
+        
+    Returns:
+        Full profile URL, or the short-form URL if it can't be constructed
+    """
+    cached_url = get_cached_athlete_url(athlete_id)
+    if cached_url:
+        return cached_url
+    
+    search_url = f"https://worldathletics.org/athletes/_/{athlete_id}"
+    
+    try:
+        html = await _get_with_retry(session, search_url)
+        
+        athlete_url = build_athlete_url(athlete_id, html)
+        if athlete_url:
+            cache_athlete_url(athlete_id, athlete_url)
+            return athlete_url
+        
+        # Fallback to short URL if we can't construct it
+        return search_url
+        
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+        print(f"⚠️  Could not construct full URL, using short format: {e}", file=sys.stderr)
+        return search_url
+
+
+async def fetch_athlete_page_async(session: "aiohttp.ClientSession", athlete_id: str) -> Optional[bytes]:
+    """
+    Async variant of fetch_athlete_page() for use with a shared aiohttp session.
+    
+    Args:
+        session: Shared aiohttp client session
+        athlete_id: World Athletics athlete ID
+        
+    Returns:
+        HTML content (bytes) or None if request failed
+    """
+    athlete_url = await get_athlete_url_async(session, athlete_id)
+    
+    try:
+        return await _get_with_retry(session, athlete_url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"❌ Failed to fetch athlete page: {e}", file=sys.stderr)
+        return None
+
+
+def create_async_session(max_connections: int = 20, limit_per_host: int = 8) -> "aiohttp.ClientSession":
+    """
+    Create an aiohttp session configured for World Athletics fetches.
+    
+    The session (and its connection pool) should be shared across all
+    concurrent fetches so keep-alive connections are reused.
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise RuntimeError("Async fetching not available - install aiohttp")
+    
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max_connections, limit_per_host=limit_per_host),
+        headers={'User-Agent': USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+
+class AsyncRateLimiter:
+    """
+    Space out request starts by a minimum interval across all tasks.
+    
+    Unlike a fixed sleep after each athlete, time already spent waiting on
+    World Athletics counts towards the interval.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._last_request = None
+    
+    async def wait(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if self._last_request is not None:
+                remaining = self.interval - (loop.time() - self._last_request)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            self._last_request = loop.time()
+
+
+async def fetch_athlete_pages_async(
+    athlete_ids: List[str],
+    concurrency: int = 4,
+    delay: float = DEFAULT_FETCH_DELAY
+) -> Dict[str, Optional[bytes]]:
+    """
+    Fetch several athlete profile pages concurrently over one shared session.
+    
+    Args:
+        athlete_ids: World Athletics athlete IDs
+        concurrency: Maximum number of pages fetched at once
+        delay: Minimum seconds between starting athlete fetches
+        
+    Returns:
+        Dict mapping each athlete ID to its HTML bytes (None if the fetch failed)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = AsyncRateLimiter(delay)
+    
+    async with create_async_session(limit_per_host=concurrency) as session:
+        async def fetch_one(athlete_id: str) -> Optional[bytes]:
+            async with semaphore:
+                # Be polite - space out requests across all concurrent fetches
+                await rate_limiter.wait()
+                return await fetch_athlete_page_async(session, athlete_id)
+        
+        pages = await asyncio.gather(*(fetch_one(athlete_id) for athlete_id in athlete_ids))
+    
+    return dict(zip(athlete_ids, pages))
+
+
 def extract_progression_data(next_data: Dict) -> Optional[List[Dict]]:
     """
     Extract progression data from the __NEXT_DATA__ structure.
@@ -215,63 +620,71 @@ def extract_progression_data(next_data: Dict) -> Optional[List[Dict]]:
         return None
 
 
-def extract_race_results(next_data: Dict, disciplines_filter: Optional[List[str]] = None) -> Optional[List[Dict]]:
+def iter_race_results(next_data: Dict, disciplines_filter: Optional[List[str]] = None) -> Iterator[RaceResult]:
     """
-    Extract detailed race results from the __NEXT_DATA__ structure.
+    Yield detailed race results from the __NEXT_DATA__ structure one at a time.
     
     Args:
         next_data: Parsed __NEXT_DATA__ JSON
         disciplines_filter: Optional list of disciplines to filter (e.g., ["Marathon", "Half Marathon"])
         
-    Returns:
-        List of race results or None if not found
+    Yields:
+        RaceResult tuples
     """
-    try:
-        props = next_data.get('props', {})
-        page_props = props.get('pageProps', {})
-        competitor = page_props.get('competitor', {})
+    props = next_data.get('props', {})
+    page_props = props.get('pageProps', {})
+    competitor = page_props.get('competitor', {})
+    
+    # Get results by year data
+    results_by_year = competitor.get('resultsByYear', {})
+    results_by_event = results_by_year.get('resultsByEvent', [])
+    year = results_by_year.get('parameters', {}).get('resultsByYear', 'Unknown')
+    
+    # Process each event's results
+    for event in results_by_event or []:
+        # Interned: the same few discipline names repeat across every season
+        discipline = sys.intern(event.get('discipline') or 'Unknown')
         
-        # Get results by year data
-        results_by_year = competitor.get('resultsByYear', {})
-        results_by_event = results_by_year.get('resultsByEvent', [])
-        year = results_by_year.get('parameters', {}).get('resultsByYear', 'Unknown')
+        # Apply discipline filter if provided
+        if disciplines_filter and discipline not in disciplines_filter:
+            continue
         
-        if not results_by_event:
-            return []
+        event_id = event.get('eventId', 'Unknown')
         
-        # Process each event's results
-        all_results = []
-        for event in results_by_event:
-            discipline = event.get('discipline', 'Unknown')
-            
-            # Apply discipline filter if provided
-            if disciplines_filter and discipline not in disciplines_filter:
-                continue
-            
-            event_id = event.get('eventId', 'Unknown')
-            
-            for result in event.get('results', []):
-                result_data = {
-                    'year': year,
-                    'discipline': discipline,
-                    'event_id': event_id,
-                    'date': result.get('date', 'Unknown'),
-                    'competition': result.get('competition', 'Unknown'),
-                    'competition_id': result.get('competitionId'),
-                    'venue': result.get('venue', 'Unknown'),
-                    'country': result.get('country', 'Unknown'),
-                    'place': result.get('place', 'Unknown'),
-                    'mark': result.get('mark', 'Unknown'),
-                    'result_score': result.get('resultScore'),
-                    'category': result.get('category', 'Unknown'),
-                    'race': result.get('race', 'Unknown'),
-                    'wind': result.get('wind'),
-                    'not_legal': result.get('notLegal', False),
-                    'remark': result.get('remark', ''),
-                }
-                all_results.append(result_data)
+        for result in event.get('results', []):
+            yield RaceResult(
+                year=year,
+                discipline=discipline,
+                event_id=event_id,
+                date=result.get('date', 'Unknown'),
+                competition=result.get('competition', 'Unknown'),
+                competition_id=result.get('competitionId'),
+                venue=result.get('venue', 'Unknown'),
+                country=result.get('country', 'Unknown'),
+                place=result.get('place', 'Unknown'),
+                mark=result.get('mark', 'Unknown'),
+                result_score=result.get('resultScore'),
+                category=result.get('category', 'Unknown'),
+                race=result.get('race', 'Unknown'),
+                wind=result.get('wind'),
+                not_legal=result.get('notLegal', False),
+                remark=result.get('remark', ''),
+            )
+
+
+def extract_race_results(next_data: Dict, disciplines_filter: Optional[List[str]] = None) -> Optional[List[RaceResult]]:
+    """
+    Extract detailed race results from the __NEXT_DATA__ structure.
+    
+    Args:
+        next_data: Parsed __NEXT_DATA__ JSON
+        disciplines_filter: Optional list of disciplines to filter (e.g., ["Marathon", "Half Marathon"])
         
-        return all_results
+    Returns:
+        List of RaceResult tuples or None if not found
+    """
+    try:
+        return list(iter_race_results(next_data, disciplines_filter))
     except (KeyError, TypeError) as e:
         print(f"❌ Failed to extract race results: {e}", file=sys.stderr)
         return None
@@ -281,7 +694,7 @@ def fetch_results_for_years(
     athlete_id: str,
     years: List[int],
     disciplines_filter: Optional[List[str]] = None
-) -> List[Dict]:
+) -> List[RaceResult]:
     """
     Fetch race results from the athlete's page.
     
@@ -300,18 +713,14 @@ def fetch_results_for_years(
     
     print(f"\n📊 Fetching race results...")
     
-    html = fetch_athlete_page(athlete_id)
-    if not html:
-        return all_results
-    
-    next_data = extract_next_data(html)
+    next_data = get_next_data_for_athlete(athlete_id)
     if not next_data:
         return all_results
     
     results = extract_race_results(next_data, disciplines_filter)
     if results:
         all_results.extend(results)
-        year = results[0]['year'] if results else 'Unknown'
+        year = results[0].year if results else 'Unknown'
         print(f"  ✅ Extracted {len(results)} results from year {year}")
     
     return all_results
@@ -347,6 +756,10 @@ def extract_basic_info(next_data: Dict) -> Optional[Dict]:
         return None
 
 
+_PROGRESSION_ROW_FMT = "  {}: {:10s} | {:12s} | {:30s} | Score: {}\n         Competition: {}\n".format
+_RACE_RESULT_ROW_FMT = "\n  📅 {:15s} | 🏁 Place: {:5s} | ⏱️  {}\n      {}\n      📍 {}\n".format
+
+
 def format_progression_for_display(progression: List[Dict]) -> None:
     """
     Print progression data in a readable format.
@@ -354,8 +767,10 @@ def format_progression_for_display(progression: List[Dict]) -> None:
     Args:
         progression: List of progression records
     """
-    print("\n📊 PROGRESSION DATA (Season's Bests by Year)\n")
-    print("=" * 80)
+    # Build the whole report and write it once instead of print()ing each line
+    buf = io.StringIO()
+    buf.write("\n📊 PROGRESSION DATA (Season's Bests by Year)\n\n")
+    buf.write("=" * 80 + "\n")
     
     for event in progression:
         discipline = event.get('discipline', 'Unknown')
@@ -363,71 +778,69 @@ def format_progression_for_display(progression: List[Dict]) -> None:
         is_main_event = event.get('mainEvent', False)
         
         marker = "⭐" if is_main_event else "  "
-        print(f"\n{marker} {discipline} (Event ID: {event_id})")
-        print("-" * 80)
+        buf.write(f"\n{marker} {discipline} (Event ID: {event_id})\n")
+        buf.write("-" * 80 + "\n")
         
         results = event.get('results', [])
         if not results:
-            print("  No results recorded")
+            buf.write("  No results recorded\n")
             continue
         
         # Sort by season (year)
         results_sorted = sorted(results, key=lambda x: x.get('season', ''))
         
         for result in results_sorted:
-            season = result.get('season')
-            mark = result.get('mark')
-            venue = result.get('venue', 'Unknown')
-            date = result.get('date', 'Unknown')
-            competition = result.get('competition', 'Unknown')
-            score = result.get('resultScore', 'N/A')
-            
-            print(f"  {season}: {mark:10s} | {date:12s} | {venue:30s} | Score: {score}")
-            print(f"         Competition: {competition}")
+            buf.write(_PROGRESSION_ROW_FMT(
+                result.get('season'),
+                result.get('mark'),
+                result.get('date', 'Unknown'),
+                result.get('venue', 'Unknown'),
+                result.get('resultScore', 'N/A'),
+                result.get('competition', 'Unknown'),
+            ))
+    
+    sys.stdout.write(buf.getvalue())
 
 
-def format_race_results_for_display(results: List[Dict]) -> None:
+def format_race_results_for_display(results: List[RaceResult]) -> None:
     """
     Display race results in a formatted table.
     
     Args:
-        results: List of race result dictionaries
+        results: List of RaceResult tuples
     """
     if not results:
         print("\n⚠️  No race results found")
         return
     
-    print(f"\n{'='*100}")
-    print(f"🏃 DETAILED RACE RESULTS")
-    print(f"{'='*100}\n")
+    buf = io.StringIO()
+    buf.write(f"\n{'='*100}\n")
+    buf.write("🏃 DETAILED RACE RESULTS\n")
+    buf.write(f"{'='*100}\n\n")
     
-    # Group by discipline
-    by_discipline = {}
+    # Group by discipline (keeping the page's discipline order)
+    by_discipline = defaultdict(list)
     for result in results:
-        discipline = result['discipline']
-        if discipline not in by_discipline:
-            by_discipline[discipline] = []
-        by_discipline[discipline].append(result)
+        by_discipline[result.discipline].append(result)
     
     # Display each discipline
     for discipline, disc_results in by_discipline.items():
-        print(f"\n{'─'*100}")
-        print(f"   {discipline} ({len(disc_results)} races)")
-        print(f"{'─'*100}")
+        buf.write(f"\n{'─'*100}\n")
+        buf.write(f"   {discipline} ({len(disc_results)} races)\n")
+        buf.write(f"{'─'*100}\n")
         
         # Sort by date (newest first)
-        disc_results.sort(key=lambda x: x['date'], reverse=True)
+        disc_results.sort(key=attrgetter('date'), reverse=True)
         
         for result in disc_results:
-            print(f"\n  📅 {result['date']:15s} | 🏁 Place: {result['place']:5s} | ⏱️  {result['mark']}")
-            print(f"      {result['competition']}")
-            print(f"      📍 {result['venue']}")
-            if result['result_score']:
-                print(f"      💯 Score: {result['result_score']}")
-            if result['remark']:
-                print(f"      💬 {result['remark']}")
-    
-    print(f"\n{'='*100}\n")
+            buf.write(_RACE_RESULT_ROW_FMT(result.date, result.place, result.mark, result.competition, result.venue))
+            if result.result_score:
+                buf.write(f"      💯 Score: {result.result_score}\n")
+            if result.remark:
+                buf.write(f"      💬 {result.remark}\n")
+    
+    buf.write(f"\n{'='*100}\n\n")
+    sys.stdout.write(buf.getvalue())
 
 
 # ============================================================================
@@ -446,16 +859,24 @@ def get_db_connection():
     return psycopg2.connect(database_url)
 
 
-def save_progression_to_db(conn, athlete_db_id: int, progression: List[Dict]) -> int:
+def save_progression_to_db(
+    conn,
+    athlete_db_id: int,
+    progression: List[Dict],
+    on_conflict: str = 'update'
+) -> int:
     """
     Save progression data to database.
     
-    Uses UPSERT to update existing records or insert new ones.
+    Uses a single multi-row UPSERT to update existing records or insert
+    new ones.
     
     Args:
         conn: Database connection
         athlete_db_id: Database ID of the athlete (from athletes table)
         progression: List of progression dictionaries
+        on_conflict: 'update' to overwrite existing records, 'ignore' to
+            keep them and only insert new ones
         
     Returns:
         Number of progression records saved
@@ -463,67 +884,80 @@ def save_progression_to_db(conn, athlete_db_id: int, progression: List[Dict]) ->
     if not progression:
         return 0
     
-    saved_count = 0
+    if on_conflict == 'ignore':
+        conflict_action = "DO NOTHING"
+    else:
+        conflict_action = """DO UPDATE SET
+                mark = EXCLUDED.mark,
+                venue = EXCLUDED.venue,
+                competition_date = EXCLUDED.competition_date,
+                competition_name = EXCLUDED.competition_name,
+                competition_id = EXCLUDED.competition_id,
+                result_score = EXCLUDED.result_score,
+                updated_at = CURRENT_TIMESTAMP"""
+    
+    # One row per (athlete, discipline, season); later duplicates win, as
+    # they did with row-by-row upserts (a single INSERT can't hit a key twice)
+    rows = {}
+    for prog in progression:
+        # Get results for this discipline
+        results = prog.get('results', [])
+        discipline = prog.get('discipline', '')
+        discipline_code = prog.get('disciplineCode')
+        discipline_url_slug = prog.get('disciplineNameUrlSlug')
+        event_type = prog.get('typeNameUrlSlug', '')
+        
+        for result in results:
+            rows[(discipline, result.get('season'))] = (
+                athlete_db_id,
+                discipline,
+                discipline_code,
+                discipline_url_slug,
+                event_type,
+                result.get('season'),
+                result.get('mark'),
+                result.get('venue'),
+                result.get('date'),
+                result.get('competition'),
+                result.get('competitionId'),
+                result.get('resultScore')
+            )
+    
+    if not rows:
+        return 0
     
     with conn.cursor() as cur:
-        for prog in progression:
-            # Get results for this discipline
-            results = prog.get('results', [])
-            discipline = prog.get('discipline', '')
-            discipline_code = prog.get('disciplineCode')
-            discipline_url_slug = prog.get('disciplineNameUrlSlug')
-            event_type = prog.get('typeNameUrlSlug', '')
-            
-            for result in results:
-                try:
-                    # UPSERT progression record
-                    cur.execute("""
-                        INSERT INTO athlete_progression (
-                            athlete_id, discipline, discipline_code, discipline_url_slug,
-                            event_type, season, mark, venue, competition_date,
-                            competition_name, competition_id, result_score
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (athlete_id, discipline, season)
-                        DO UPDATE SET
-                            mark = EXCLUDED.mark,
-                            venue = EXCLUDED.venue,
-                            competition_date = EXCLUDED.competition_date,
-                            competition_name = EXCLUDED.competition_name,
-                            competition_id = EXCLUDED.competition_id,
-                            result_score = EXCLUDED.result_score,
-                            updated_at = CURRENT_TIMESTAMP
-                    """, (
-                        athlete_db_id,
-                        discipline,
-                        discipline_code,
-                        discipline_url_slug,
-                        event_type,
-                        result.get('season'),
-                        result.get('mark'),
-                        result.get('venue'),
-                        result.get('date'),
-                        result.get('competition'),
-                        result.get('competitionId'),
-                        result.get('resultScore')
-                    ))
-                    saved_count += 1
-                except Exception as e:
-                    print(f"    ⚠️  Error saving progression for {discipline} {result.get('season')}: {e}")
-                    continue
-    
-    return saved_count
-
-
-def save_race_results_to_db(conn, athlete_db_id: int, race_results: List[Dict]) -> int:
+        # UPSERT all progression records in a single statement
+        execute_values(cur, f"""
+            INSERT INTO athlete_progression (
+                athlete_id, discipline, discipline_code, discipline_url_slug,
+                event_type, season, mark, venue, competition_date,
+                competition_name, competition_id, result_score
+            ) VALUES %s
+            ON CONFLICT (athlete_id, discipline, season)
+            {conflict_action}
+        """, list(rows.values()), page_size=len(rows))
+        return cur.rowcount
+
+
+def save_race_results_to_db(
+    conn,
+    athlete_db_id: int,
+    race_results: List[RaceResult],
+    on_conflict: str = 'update'
+) -> int:
     """
     Save race results to database.
     
-    Uses UPSERT to update existing records or insert new ones.
+    Uses a single multi-row UPSERT to update existing records or insert
+    new ones.
     
     Args:
         conn: Database connection
         athlete_db_id: Database ID of the athlete (from athletes table)
-        race_results: List of race result dictionaries
+        race_results: List of RaceResult tuples
+        on_conflict: 'update' to overwrite existing records, 'ignore' to
+            keep them and only insert new ones
         
     Returns:
         Number of race results saved
@@ -531,43 +965,102 @@ def save_race_results_to_db(conn, athlete_db_id: int, race_results: List[Dict])
     if not race_results:
         return 0
     
-    saved_count = 0
+    if on_conflict == 'ignore':
+        conflict_action = "DO NOTHING"
+    else:
+        conflict_action = """DO UPDATE SET
+                position = EXCLUDED.position,
+                finish_time = EXCLUDED.finish_time,
+                race_points = EXCLUDED.race_points,
+                venue = EXCLUDED.venue,
+                updated_at = CURRENT_TIMESTAMP"""
+    
+    # One row per conflict key; later duplicates win (see above)
+    rows = {}
+    for result in race_results:
+        key = (result.year, result.date, result.competition, result.discipline)
+        rows[key] = (
+            athlete_db_id,
+            result.year,
+            result.date,
+            result.competition,
+            result.competition_id,
+            result.venue,
+            result.discipline,
+            result.place,
+            result.mark,
+            result.result_score
+        )
     
     with conn.cursor() as cur:
-        for result in race_results:
-            try:
-                # UPSERT race result
-                cur.execute("""
-                    INSERT INTO athlete_race_results (
-                        athlete_id, year, competition_date, competition_name,
-                        competition_id, venue, discipline, position,
-                        finish_time, race_points
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (athlete_id, year, competition_date, competition_name, discipline)
-                    DO UPDATE SET
-                        position = EXCLUDED.position,
-                        finish_time = EXCLUDED.finish_time,
-                        race_points = EXCLUDED.race_points,
-                        venue = EXCLUDED.venue,
-                        updated_at = CURRENT_TIMESTAMP
-                """, (
-                    athlete_db_id,
-                    result.get('year'),
-                    result.get('date'),
-                    result.get('competition'),
-                    result.get('competitionId'),
-                    result.get('venue'),
-                    result.get('discipline'),
-                    result.get('place'),
-                    result.get('mark'),
-                    result.get('resultScore')
-                ))
-                saved_count += 1
-            except Exception as e:
-                print(f"    ⚠️  Error saving race result for {result.get('competition')}: {e}")
-                continue
-    
-    return saved_count
+        # UPSERT all race results in a single statement
+        execute_values(cur, f"""
+            INSERT INTO athlete_race_results (
+                athlete_id, year, competition_date, competition_name,
+                competition_id, venue, discipline, position,
+                finish_time, race_points
+            ) VALUES %s
+            ON CONFLICT (athlete_id, year, competition_date, competition_name, discipline)
+            {conflict_action}
+        """, list(rows.values()), page_size=len(rows))
+        return cur.rowcount
+
+
+def save_progression_data(
+    athlete_db_id: int,
+    progression: List[Dict],
+    race_results: List[RaceResult],
+    conn=None,
+    verbose: bool = True,
+    on_conflict: str = 'update',
+    raise_errors: bool = False
+) -> Tuple[int, int]:
+    """
+    Save progression and race results for one athlete in a single transaction.
+    
+    Args:
+        athlete_db_id: Database ID from athletes table
+        progression: List of progression dictionaries
+        race_results: List of RaceResult tuples
+        conn: Optional open connection to reuse (left open); when omitted a
+            new connection is opened and closed for this save
+        verbose: Whether to print the saved record counts (errors are
+            always printed)
+        on_conflict: 'update' to overwrite existing records, 'ignore' to
+            keep them and only insert new ones
+        raise_errors: If True, re-raise database errors (after printing
+            them) instead of returning (0, 0), so callers reusing a
+            connection can tell a failed save from an empty one
+        
+    Returns:
+        Tuple of (progression_saved_count, results_saved_count)
+    """
+    progression_saved = 0
+    results_saved = 0
+    owns_conn = conn is None
+    
+    try:
+        if owns_conn:
+            conn = get_db_connection()
+        try:
+            progression_saved = save_progression_to_db(conn, athlete_db_id, progression, on_conflict)
+            results_saved = save_race_results_to_db(conn, athlete_db_id, race_results, on_conflict)
+            conn.commit()
+            if verbose:
+                print(f"    ✓ Saved {progression_saved} progression records and {results_saved} race results to database")
+        except Exception:
+            conn.rollback()
+            progression_saved = results_saved = 0
+            raise
+        finally:
+            if owns_conn:
+                conn.close()
+    except Exception as e:
+        print(f"    ❌ Database error: {e}")
+        if raise_errors:
+            raise
+    
+    return progression_saved, results_saved
 
 
 def fetch_and_save_progression_data(
@@ -575,7 +1068,7 @@ def fetch_and_save_progression_data(
     athlete_db_id: int,
     disciplines_filter: Optional[List[str]] = None,
     save_to_db: bool = True
-) -> Tuple[List[Dict], List[Dict], int, int]:
+) -> Tuple[List[Dict], List[RaceResult], int, int]:
     """
     Fetch progression and race results for an athlete and optionally save to database.
     
@@ -592,13 +1085,8 @@ def fetch_and_save_progression_data(
     """
     print(f"  📊 Fetching progression data for athlete {athlete_id}...")
     
-    # Fetch the athlete page
-    html = fetch_athlete_page(athlete_id)
-    if not html:
-        return [], [], 0, 0
-    
-    # Extract __NEXT_DATA__
-    next_data = extract_next_data(html)
+    # Fetch the athlete page and extract __NEXT_DATA__
+    next_data = get_next_data_for_athlete(athlete_id)
     if not next_data:
         return [], [], 0, 0
     
@@ -615,17 +1103,60 @@ def fetch_and_save_progression_data(
     
     # Save to database if requested
     if save_to_db and DB_AVAILABLE:
-        try:
-            conn = get_db_connection()
-            try:
-                progression_saved = save_progression_to_db(conn, athlete_db_id, progression)
-                results_saved = save_race_results_to_db(conn, athlete_db_id, race_results)
-                conn.commit()
-                print(f"    ✓ Saved {progression_saved} progression records and {results_saved} race results to database")
-            finally:
-                conn.close()
-        except Exception as e:
-            print(f"    ❌ Database error: {e}")
+        progression_saved, results_saved = save_progression_data(athlete_db_id, progression, race_results)
+    
+    return progression, race_results, progression_saved, results_saved
+
+
+async def fetch_and_save_progression_data_async(
+    session: "aiohttp.ClientSession",
+    athlete_id: str,
+    athlete_db_id: int,
+    disciplines_filter: Optional[List[str]] = None,
+    save_to_db: bool = True,
+    verbose: bool = True
+) -> Tuple[List[Dict], List[RaceResult], int, int]:
+    """
+    Async variant of fetch_and_save_progression_data().
+    
+    The page fetch runs on the event loop; the (blocking) database save runs
+    in the default executor so other fetches can proceed meanwhile.
+    
+    Args:
+        session: Shared aiohttp client session
+        athlete_id: World Athletics athlete ID
+        athlete_db_id: Database ID from athletes table
+        disciplines_filter: Optional list of disciplines to filter
+        save_to_db: Whether to save to database (default: True)
+        verbose: Whether to print progress messages (errors are always printed)
+        
+    Returns:
+        Tuple of (progression, race_results, progression_saved_count, results_saved_count)
+    """
+    if verbose:
+        print(f"  📊 Fetching progression data for athlete {athlete_id}...")
+    
+    html = await fetch_athlete_page_async(session, athlete_id)
+    if not html:
+        return [], [], 0, 0
+    
+    next_data = extract_next_data(html)
+    if not next_data:
+        return [], [], 0, 0
+    
+    progression = extract_progression_data(next_data) or []
+    race_results = extract_race_results(next_data, disciplines_filter)
+    if verbose:
+        print(f"    ✓ Athlete {athlete_id}: extracted {len(progression)} progression events and {len(race_results)} race results")
+    
+    progression_saved = 0
+    results_saved = 0
+    
+    if save_to_db and DB_AVAILABLE:
+        loop = asyncio.get_running_loop()
+        progression_saved, results_saved = await loop.run_in_executor(
+            None, save_progression_data, athlete_db_id, progression, race_results, None, verbose
+        )
     
     return progression, race_results, progression_saved, results_saved
 
@@ -633,7 +1164,7 @@ def fetch_and_save_progression_data(
 def save_data_json(
     athlete_info: Dict,
     progression: List[Dict],
-    race_results: Optional[List[Dict]],
+    race_results: Optional[List[RaceResult]],
     output_file: str
 ) -> None:
     """
@@ -650,16 +1181,95 @@ def save_data_json(
     output_data = {
         'athlete': athlete_info,
         'progression': progression,
-        'race_results': race_results or [],
+        'race_results': [result._asdict() for result in race_results or []],
         'extracted_at': datetime.now().isoformat()
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        # Encode to UTF-8 bytes in one call and write them in one go
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
     
     print(f"\n✅ Saved data to: {output_file}")
 
 
+def process_athlete_page(html: Optional[bytes], athlete_id: str, args: argparse.Namespace) -> bool:
+    """
+    Extract, display and save the data from one fetched profile page.
+    
+    Args:
+        html: HTML content of the profile page (None if the fetch failed)
+        athlete_id: World Athletics athlete ID (used for the default filename)
+        args: Parsed command-line arguments
+        
+    Returns:
+        True if progression data was extracted, False otherwise
+    """
+    if not html:
+        return False
+    
+    print(f"✅ Page fetched successfully ({athlete_id})")
+    
+    # Extract __NEXT_DATA__
+    print("🔍 Extracting __NEXT_DATA__ JSON...")
+    next_data = extract_next_data(html)
+    
+    if not next_data:
+        return False
+    
+    print("✅ JSON extracted successfully")
+    
+    # Extract athlete info
+    athlete_info = extract_basic_info(next_data)
+    if athlete_info:
+        print(f"\n👤 Athlete: {athlete_info['given_name']} {athlete_info['family_name']}")
+        print(f"   Country: {athlete_info['country_name']} ({athlete_info['country_code']})")
+        print(f"   Born: {athlete_info['birth_date']}")
+    
+    # Extract progression data
+    print("\n📈 Extracting progression data...")
+    progression = extract_progression_data(next_data)
+    
+    if not progression:
+        return False
+    
+    print(f"✅ Found progression data for {len(progression)} events")
+    
+    # Display progression data (unless --no-display)
+    if not args.no_display:
+        format_progression_for_display(progression)
+    
+    # Extract race results if years specified
+    race_results = []
+    if args.years:
+        print(f"\n🏁 Extracting race results...")
+        current_results = extract_race_results(next_data, args.disciplines)
+        
+        if current_results:
+            race_results.extend(current_results)
+            year = current_results[0].year
+            print(f"  ✅ Extracted {len(current_results)} results from year {year}")
+            
+            if not args.no_display:
+                format_race_results_for_display(current_results)
+        else:
+            print(f"  ⚠️  No results found")
+    
+    # Save to JSON file
+    if args.output:
+        output_file = args.output
+    else:
+        output_file = f"data_{athlete_id}.json"
+    
+    if athlete_info and progression:
+        save_data_json(athlete_info, progression, race_results if race_results else None, output_file)
+    
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Extract athlete progression data and race results from World Athletics profiles',
@@ -675,6 +1285,9 @@ Examples:
   # Filter by discipline (Marathon and Half Marathon only)
   %(prog)s --athlete-id 14593938 --disciplines "Marathon" "Half Marathon" --years 2024 2025
   
+  # Fetch several athletes concurrently (one data_<id>.json each)
+  %(prog)s --athlete-id 14593938 14208194 --concurrency 4
+  
   # Save to specific file
   %(prog)s --url "https://worldathletics.org/athletes/kenya/peres-jepchirchir-14593938" --output peres.json
         """
@@ -684,7 +1297,8 @@ Examples:
     group.add_argument(
         '--athlete-id',
         type=str,
-        help='World Athletics athlete ID (e.g., 14593938)'
+        nargs='+',
+        help='World Athletics athlete ID(s) (e.g., 14593938); several IDs are fetched concurrently'
     )
     group.add_argument(
         '--url',
@@ -718,79 +1332,55 @@ Examples:
         help='Do not display data (only save to file)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum pages fetched at once when several athlete IDs are given (default: 4)'
+    )
+    
     args = parser.parse_args()
     
+    # Drop repeated IDs (keeping order) so each page is fetched once
+    if args.athlete_id:
+        args.athlete_id = list(dict.fromkeys(args.athlete_id))
+    
+    # Several athlete IDs: fetch the pages concurrently, then process each
+    if args.athlete_id and len(args.athlete_id) > 1:
+        if args.output:
+            parser.error("--output can only be used with a single athlete")
+        
+        print(f"🌐 Fetching {len(args.athlete_id)} athlete profile pages...")
+        if AIOHTTP_AVAILABLE:
+            pages = asyncio.run(fetch_athlete_pages_async(args.athlete_id, args.concurrency))
+        else:
+            pages = {athlete_id: fetch_athlete_page(athlete_id) for athlete_id in args.athlete_id}
+        
+        failed = [athlete_id for athlete_id in args.athlete_id
+                  if not process_athlete_page(pages[athlete_id], athlete_id, args)]
+        
+        if failed:
+            print(f"\n❌ Failed for {len(failed)} athlete(s): {', '.join(failed)}")
+            sys.exit(1)
+        
+        print("\n✅ Done!")
+        return
+    
     # Fetch the page
     print("🌐 Fetching athlete profile page...")
     
     if args.url:
         html = fetch_athlete_page_by_url(args.url)
         # Extract athlete ID from URL for filename
-        match = re.search(r'(\d+)$', args.url)
+        match = _URL_ATHLETE_ID_RE.search(args.url)
         athlete_id = match.group(1) if match else 'unknown'
     else:
-        html = fetch_athlete_page(args.athlete_id)
-        athlete_id = args.athlete_id
+        athlete_id = args.athlete_id[0]
+        html = fetch_athlete_page(athlete_id)
     
-    if not html:
+    if not process_athlete_page(html, athlete_id, args):
         sys.exit(1)
     
-    print("✅ Page fetched successfully")
-    
-    # Extract __NEXT_DATA__
-    print("🔍 Extracting __NEXT_DATA__ JSON...")
-    next_data = extract_next_data(html)
-    
-    if not next_data:
-        sys.exit(1)
-    
-    print("✅ JSON extracted successfully")
-    
-    # Extract athlete info
-    athlete_info = extract_basic_info(next_data)
-    if athlete_info:
-        print(f"\n👤 Athlete: {athlete_info['given_name']} {athlete_info['family_name']}")
-        print(f"   Country: {athlete_info['country_name']} ({athlete_info['country_code']})")
-        print(f"   Born: {athlete_info['birth_date']}")
-    
-    # Extract progression data
-    print("\n📈 Extracting progression data...")
-    progression = extract_progression_data(next_data)
-    
-    if not progression:
-        sys.exit(1)
-    
-    print(f"✅ Found progression data for {len(progression)} events")
-    
-    # Display progression data (unless --no-display)
-    if not args.no_display:
-        format_progression_for_display(progression)
-    
-    # Extract race results if years specified
-    race_results = []
-    if args.years:
-        print(f"\n🏁 Extracting race results...")
-        current_results = extract_race_results(next_data, args.disciplines)
-        
-        if current_results:
-            race_results.extend(current_results)
-            year = current_results[0]['year']
-            print(f"  ✅ Extracted {len(current_results)} results from year {year}")
-            
-            if not args.no_display:
-                format_race_results_for_display(current_results)
-        else:
-            print(f"  ⚠️  No results found")
-    
-    # Save to JSON file
-    if args.output:
-        output_file = args.output
-    else:
-        output_file = f"data_{athlete_id}.json"
-    
-    if athlete_info and progression:
-        save_data_json(athlete_info, progression, race_results if race_results else None, output_file)
-    
     print("\n✅ Done!")
 
 
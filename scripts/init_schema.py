@@ -4,9 +4,16 @@ Initialize database schema with new progression tables.
 
 This script reads schema.sql and executes it against the database
 specified in the DATABASE_URL environment variable.
+
+Statements run one at a time in autocommit mode, so a failing statement is
+reported and skipped without undoing the ones around it. The triggers use
+CREATE OR REPLACE TRIGGER, which needs PostgreSQL 14+ (as on Neon); on older
+servers those statements fail and are reported, and everything else still
+runs.
 """
 
 import os
+import re
 import sys
 import psycopg2
 from pathlib import Path
@@ -24,6 +31,62 @@ def load_env_file():
                     value = value.strip('"').strip("'")
                     os.environ[key] = value
 
+# Dollar-quote opener/closer such as $$ or $body$
+_DOLLAR_TAG_RE = re.compile(r'\$[A-Za-z_]*\$')
+
+
+def split_sql_statements(sql):
+    """
+    Split a SQL script into individual statements on top-level semicolons.
+    
+    Semicolons inside quotes, dollar-quoted bodies ($$ ... $$) and comments
+    don't end a statement, so function definitions stay in one piece.
+    Comment-only chunks are dropped.
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(sql)
+    while i < n:
+        ch = sql[i]
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = n if end < 0 else end + 1
+        elif sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+        elif ch in ("'", '"'):
+            # '' / "" escapes just close and reopen the quote
+            end = sql.find(ch, i + 1)
+            i = n if end < 0 else end + 1
+        elif ch == '$' and _DOLLAR_TAG_RE.match(sql, i):
+            tag = _DOLLAR_TAG_RE.match(sql, i).group()
+            end = sql.find(tag, i + len(tag))
+            i = n if end < 0 else end + len(tag)
+        elif ch == ';':
+            statements.append(sql[start:i])
+            i += 1
+            start = i
+        else:
+            i += 1
+    statements.append(sql[start:])
+    
+    # Keep only chunks with something besides whitespace and line comments
+    return [
+        statement.strip() for statement in statements
+        if any(line.strip() and not line.strip().startswith('--') for line in statement.splitlines())
+    ]
+
+
+def _statement_summary(statement):
+    """First non-comment line of a statement, for progress and error output"""
+    for line in statement.splitlines():
+        line = line.strip()
+        if line and not line.startswith('--'):
+            return line if len(line) <= 80 else line[:77] + '...'
+    return ''
+
+
 def init_schema():
     """Initialize database schema"""
     # Load environment variables
@@ -53,47 +116,48 @@ def init_schema():
         conn.set_session(autocommit=True)  # Use autocommit mode to avoid transaction issues
         cur = conn.cursor()
         
-        # Split schema into individual statements
-        # Remove comments and split by semicolons
-        statements = []
-        for line in schema_sql.split('\n'):
-            if not line.strip().startswith('--'):
-                statements.append(line)
-        
-        full_sql = '\n'.join(statements)
-        individual_statements = [s.strip() for s in full_sql.split(';') if s.strip()]
+        # Run statements one at a time: in autocommit mode a failure (e.g. an
+        # index on a column an older table lacks, since CREATE TABLE IF NOT
+        # EXISTS never adds columns) is reported without rolling back the
+        # rest. schema.sql is idempotent (IF NOT EXISTS / OR REPLACE), so
+        # re-running it against an existing database is safe.
+        statements = split_sql_statements(schema_sql)
+        print(f"📝 Executing {len(statements)} SQL statements...")
         
-        print(f"📝 Executing {len(individual_statements)} SQL statements...")
+        failed = 0
+        for i, statement in enumerate(statements, 1):
+            try:
+                cur.execute(statement)
+                print(f"  ✓ Statement {i}/{len(statements)}")
+            except psycopg2.Error as e:
+                # Ignore "already exists" errors
+                if 'already exists' in str(e):
+                    print(f"  ⚠️  Statement {i}/{len(statements)} - Already exists (skipped)")
+                else:
+                    failed += 1
+                    print(f"  ❌ Statement {i}/{len(statements)} failed: {_statement_summary(statement)}")
+                    print(f"     Error: {e}")
+                    # Don't raise - continue with other statements
         
-        # Execute each statement
-        for i, statement in enumerate(individual_statements, 1):
-            if statement.strip():
-                try:
-                    cur.execute(statement)
-                    print(f"  ✓ Statement {i}/{len(individual_statements)}")
-                except psycopg2.Error as e:
-                    # Ignore "already exists" errors
-                    if 'already exists' in str(e):
-                        print(f"  ⚠️  Statement {i}/{len(individual_statements)} - Already exists (skipped)")
-                    else:
-                        print(f"  ❌ Statement {i}/{len(individual_statements)} - Error: {e}")
-                        # Don't raise - continue with other statements
-        print("\n✅ Database schema initialized successfully!")
+        if failed:
+            print(f"\n⚠️  Database schema initialized with {failed} failed statement(s) (see above)")
+        else:
+            print("\n✅ Database schema initialized successfully!")
         
-        # Check which tables exist
+        # List tables with their row counts from the statistics catalog: one
+        # query instead of a COUNT(*) scan per table. n_live_tup is an
+        # estimate, which is plenty for this summary.
         cur.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            ORDER BY table_name
+            SELECT relname, n_live_tup
+            FROM pg_stat_user_tables
+            WHERE schemaname = 'public'
+            ORDER BY relname
         """)
-        tables = [row[0] for row in cur.fetchall()]
+        tables = cur.fetchall()
         
         print(f"\n📊 Tables in database ({len(tables)}):")
-        for table in tables:
-            cur.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cur.fetchone()[0]
-            print(f"  - {table}: {count} records")
+        for table, count in tables:
+            print(f"  - {table}: ~{count} records")
         
         cur.close()
         conn.close()
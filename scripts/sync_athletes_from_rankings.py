@@ -10,11 +10,15 @@ This script combines all the logic needed to:
 5. Update the Neon Postgres database with new/changed athlete data
 
 Usage:
-    python3 scripts/sync_athletes_from_rankings.py [--dry-run] [--limit N]
+    python3 scripts/sync_athletes_from_rankings.py [--dry-run] [--limit N] [--verbose]
 
 Options:
     --dry-run       Show what would be updated without making changes
     --limit N       Limit to top N athletes per gender (default: 100)
+    --verbose       Print every athlete row scraped from the rankings pages
+
+Set WA_HTTP_CACHE_HOURS=N (with requests-cache installed) to cache World
+Athletics responses on disk for N hours, so local re-runs don't refetch pages.
 """
 
 import os
@@ -23,23 +27,46 @@ import json
 import time
 import hashlib
 import argparse
+import random
 import re
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+
+from wa_next_data import NEXT_DATA_MARKER, SCRIPT_END, read_until_next_data
 
 # Database imports
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_values
 except ImportError:
     print("Error: psycopg2 not installed. Run: pip install psycopg2-binary")
     sys.exit(1)
 
+# Optional: on-disk HTTP cache for local re-runs (see WA_HTTP_CACHE_HOURS)
+try:
+    import requests_cache
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
+# Faster JSON parsing (optional - falls back to the json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import progression extraction functions
 try:
     from extract_athlete_progression import fetch_and_save_progression_data
@@ -74,11 +101,111 @@ RANKING_URL_TEMPLATE = f"{BASE_URL}/world-rankings/marathon/{{gender}}?page={{pa
 REQUEST_TIMEOUT = 30
 DELAY_BETWEEN_REQUESTS = 2  # Be polite to the server
 DELAY_BETWEEN_PROFILES = 3  # Even more polite for profile fetches
+DELAY_BETWEEN_PROGRESSION = 2  # Between progression page fetches
+REQUEST_JITTER = (0, 0.5)  # Random extra seconds added to each delay
 # Batching limit: prevent timeouts when many athletes need enrichment
 # Math: 50 athletes × 3 seconds = 150 seconds + API overhead ≈ 3-5 minutes (safe margin under 30-min timeout)
 # In case of mass updates (e.g., ranking system changes), will process over multiple runs
 MAX_ENRICHMENTS_PER_RUN = 50  # Limit enrichments to prevent timeouts (~3-5 minutes per run)
 IMAGE_TEST_TIMEOUT = 5  # Timeout for testing image URLs
+FETCH_WORKERS = 4  # Profile/progression pages fetched at once (still paced by the rate limiters)
+# Off by default: a cached profile could predate the score change that
+# triggered its refetch, so scheduled syncs always go to the network
+HTTP_CACHE_HOURS = float(os.environ.get('WA_HTTP_CACHE_HOURS') or 0)
+# Rankings tables from earlier runs with their ETag/Last-Modified, so an
+# unchanged page can be revalidated with a 304 instead of downloaded again
+RANKINGS_CACHE_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    / 'marathon-majors-league' / 'rankings_pages.sqlite'
+)
+IMAGE_TEST_WORKERS = 8  # Headshot probes run at once (stays under the session's pool size)
+VERBOSE = False  # Print every scraped rankings row (--verbose)
+
+
+class RateLimiter:
+    """
+    Keep requests at least `min_interval` seconds apart, plus random jitter.
+    
+    Time already spent on the previous request counts towards the interval,
+    unlike a fixed sleep after each one. Safe to share between threads.
+    """
+    
+    def __init__(self, min_interval: float, jitter_range: Tuple[float, float] = REQUEST_JITTER):
+        self.min_interval = min_interval
+        self.jitter_range = jitter_range
+        self.last_request_time = None
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the next request may be sent."""
+        with self._lock:
+            if self.last_request_time is not None:
+                # Jitter stretches the interval rather than being added on top,
+                # so a request that already took longer than that isn't delayed
+                interval = self.min_interval + random.uniform(*self.jitter_range)
+                sleep_needed = interval - (time.monotonic() - self.last_request_time)
+                if sleep_needed > 0:
+                    time.sleep(sleep_needed)
+            self.last_request_time = time.monotonic()
+
+
+# Shared HTTP session: reuses connections to World Athletics across the many
+# rankings/profile requests and retries rate-limited/transient failures.
+# With WA_HTTP_CACHE_HOURS set, successful responses are also cached on disk.
+if HTTP_CACHE_HOURS > 0 and CACHE_AVAILABLE:
+    SESSION = requests_cache.CachedSession(
+        'wa_sync_cache',
+        backend='sqlite',
+        use_cache_dir=True,
+        expire_after=timedelta(hours=HTTP_CACHE_HOURS),
+        allowable_methods=('GET', 'HEAD'),
+        allowable_codes=(200,),
+        # Server Cache-Control headers win over expire_after, and a cached copy
+        # is better than nothing if World Athletics errors out mid-run
+        cache_control=True,
+        stale_if_error=True
+    )
+else:
+    if HTTP_CACHE_HOURS > 0:
+        print("⚠️  WA_HTTP_CACHE_HOURS is set but requests-cache is not installed - caching disabled")
+    SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Rankings table rows carry the athlete's profile path in data-athlete-url
+_ROWS_XPATH = etree.XPath('//table//tr[@data-athlete-url]')
+_ROW_MARKER = b'data-athlete-url'
+# A sliced-out table has no <meta charset>, so tell lxml the page encoding
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+# Profile paths end with the athlete ID, e.g. /athletes/kenya/eliud-kipchoge-14208194
+_ATHLETE_ID_RE = re.compile(r'-(\d{7,})(?:/|$)')
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+# Ranking lines in profile page text, used when __NEXT_DATA__ is unusable
+_MARATHON_RANK_RE = re.compile(r'#(\d+)\s+(?:Man\'s|Woman\'s)\s+marathon', re.IGNORECASE)
+_ROAD_RUNNING_RANK_RE = re.compile(r'#(\d+)\s+(?:Man\'s|Woman\'s)\s+road\s+running', re.IGNORECASE)
+# World Athletics birth dates that aren't ISO look like "13 NOV 1984"
+_WA_BIRTH_DATE_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})$')
+_MONTHS = {name: number for number, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1
+)}
+
+# One limiter per kind of page, shared by every fetch of that kind
+RANKINGS_RATE_LIMITER = RateLimiter(DELAY_BETWEEN_REQUESTS)
+PROFILE_RATE_LIMITER = RateLimiter(DELAY_BETWEEN_PROFILES)
+PROGRESSION_RATE_LIMITER = RateLimiter(DELAY_BETWEEN_PROGRESSION)
 
 # ============================================================================
 # IMAGE TESTING HELPER
@@ -102,26 +229,46 @@ def normalize_wa_id(wa_id: str) -> str:
     return wa_id.lstrip('0') or '0'  # Keep '0' if the ID is all zeros
 
 
+@lru_cache(maxsize=4096)
 def test_image_accessible(url: str) -> bool:
     """
     Test if an image URL is accessible.
     
     Returns True if the URL returns a successful response, False otherwise.
     This is used to check if World Athletics headshot URLs are working or
-    if we should use placeholder images.
+    if we should use placeholder images. Results are remembered for the rest
+    of the run, so each headshot is probed at most once.
     """
     try:
-        response = requests.head(url, timeout=IMAGE_TEST_TIMEOUT, allow_redirects=True)
+        response = SESSION.head(url, timeout=IMAGE_TEST_TIMEOUT, allow_redirects=True)
         return response.status_code == 200
     except requests.RequestException:
         # If HEAD fails, try GET with timeout
         try:
-            response = requests.get(url, timeout=IMAGE_TEST_TIMEOUT, stream=True)
-            return response.status_code == 200
+            # Close the streamed response so its connection returns to the pool
+            with SESSION.get(url, timeout=IMAGE_TEST_TIMEOUT, stream=True) as response:
+                return response.status_code == 200
         except requests.RequestException:
             return False
 
 
+def test_images_bulk(urls: List[str]) -> Dict[str, bool]:
+    """
+    Test many image URLs at once.
+    
+    The probes are independent HEAD/GET requests, so they run on a thread
+    pool over the shared session instead of one after another.
+    
+    Returns:
+        Dict mapping each URL to whether it is accessible
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=IMAGE_TEST_WORKERS) as executor:
+        return dict(zip(unique_urls, executor.map(test_image_accessible, unique_urls)))
+
+
 def get_placeholder_url(gender: str) -> str:
     """Get the appropriate placeholder image URL based on gender."""
     gender_lower = gender.lower() if gender else 'men'
@@ -134,6 +281,56 @@ def get_placeholder_url(gender: str) -> str:
 # PART 1: EXTRACTING RANKINGS
 # ============================================================================
 
+def _open_rankings_cache() -> sqlite3.Connection:
+    """Open the rankings page cache database, creating it if needed."""
+    RANKINGS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(RANKINGS_CACHE_PATH, timeout=10)
+    cache.execute("""
+        CREATE TABLE IF NOT EXISTS rankings_pages (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content BLOB NOT NULL
+        )
+    """)
+    return cache
+
+
+def get_cached_rankings_page(url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+    """
+    Look up a rankings table saved by an earlier run.
+    
+    Returns:
+        (etag, last_modified, table HTML bytes), or None if not cached
+    """
+    try:
+        cache = _open_rankings_cache()
+        try:
+            return cache.execute(
+                "SELECT etag, last_modified, content FROM rankings_pages WHERE url = ?", (url,)
+            ).fetchone()
+        finally:
+            cache.close()
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def cache_rankings_page(url: str, etag: Optional[str], last_modified: Optional[str], content: bytes) -> None:
+    """Save a rankings table with its validators for the next run (best effort)."""
+    try:
+        cache = _open_rankings_cache()
+        try:
+            with cache:
+                cache.execute(
+                    "INSERT OR REPLACE INTO rankings_pages (url, etag, last_modified, content) VALUES (?, ?, ?, ?)",
+                    (url, etag, last_modified, content)
+                )
+        finally:
+            cache.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
 def scrape_rankings_page(gender: str, page: int) -> List[Dict]:
     """
     Scrape a single page of World Rankings.
@@ -141,16 +338,52 @@ def scrape_rankings_page(gender: str, page: int) -> List[Dict]:
     Returns list of athlete dictionaries with basic data from rankings table.
     """
     url = RANKING_URL_TEMPLATE.format(gender=gender, page=page)
+    
+    # Be polite to the server
+    RANKINGS_RATE_LIMITER.wait()
     print(f"  Fetching page {page}: {url}")
     
+    # Revalidate the copy from the last run: rankings only change weekly,
+    # and a 304 carries no body
+    cached = get_cached_rankings_page(url)
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if response.status_code == 304 and cached:
+            print(f"  Page {page} unchanged since last run - using cached table")
+            content = cached[2]
+        else:
+            response.raise_for_status()
+            content = response.content
+        
+        # Only the rankings table is needed: find it with byte searches and
+        # parse just that slice instead of the whole page
+        first_row = content.find(_ROW_MARKER)
+        if first_row < 0:
+            print(f"  No athlete rows found on page {page}")
+            return []
+        table_start = content.rfind(b'<table', 0, first_row)
+        table_end = content.find(b'</table>', first_row)
+        if table_start >= 0 and table_end >= 0:
+            content = content[table_start:table_end + len(b'</table>')]
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code == 200 and (etag or last_modified):
+            cache_rankings_page(url, etag, last_modified, content)
+        
+        tree = lxml_html.fromstring(content, parser=_UTF8_HTML_PARSER)
         
         # Each athlete row has a data-athlete-url attribute
-        rows = soup.select('table tr[data-athlete-url]')
+        rows = _ROWS_XPATH(tree)
         
         if not rows:
             print(f"  No athlete rows found on page {page}")
@@ -166,33 +399,34 @@ def scrape_rankings_page(gender: str, page: int) -> List[Dict]:
                 
                 if profile_url:
                     full_profile_url = urljoin(BASE_URL, profile_url)
-                    # Example: /athletes/kenya/eliud-kipchoge-14208194
-                    parts = profile_url.split('/')[-1].split('-')
-                    for part in reversed(parts):
-                        if part.isdigit() and len(part) >= 7:
-                            athlete_id = normalize_wa_id(part)
-                            break
+                    id_match = _ATHLETE_ID_RE.search(profile_url)
+                    if id_match:
+                        athlete_id = normalize_wa_id(id_match.group(1))
                 
-                cells = row.select('td')
+                # Text of each cell, whitespace-stripped per text node. Cells are
+                # direct children, so iterate them without a path lookup
+                cells = [''.join(text.strip() for text in cell.itertext()) for cell in row.iterchildren('td')]
                 if len(cells) < 5:
                     continue
                 
                 # Extract data from table cells
-                rank_text = cells[0].get_text(strip=True)
+                rank_text = cells[0]
                 if not rank_text.isdigit():
                     continue
                 
                 rank = int(rank_text)
-                name = cells[1].get_text(strip=True)
-                dob = cells[2].get_text(strip=True) if len(cells) > 2 else None
+                name = cells[1]
+                dob = cells[2] if len(cells) > 2 else None
                 
                 # Country - extract 3-letter code
-                country = cells[3].get_text(strip=True)
+                country = cells[3]
                 if country:
-                    country = country.split()[0]  # Take first code if multiple
+                    # Take first code if multiple; interned, since the same
+                    # few codes repeat across every page and athlete
+                    country = sys.intern(country.split()[0])
                 
                 # World Athletics Score (column 4) - their rolling 18-month score
-                wa_score = cells[4].get_text(strip=True) if len(cells) > 4 else None
+                wa_score = cells[4] if len(cells) > 4 else None
                 # Convert to integer if present
                 try:
                     wa_score = int(wa_score) if wa_score else None
@@ -211,7 +445,8 @@ def scrape_rankings_page(gender: str, page: int) -> List[Dict]:
                 }
                 
                 athletes.append(athlete_data)
-                print(f"    {rank}. {name} ({country}) - ID: {athlete_id or 'N/A'}")
+                if VERBOSE:
+                    print(f"    {rank}. {name} ({country}) - ID: {athlete_id or 'N/A'}")
                 
             except Exception as e:
                 print(f"    Warning: Error parsing row: {e}")
@@ -220,7 +455,7 @@ def scrape_rankings_page(gender: str, page: int) -> List[Dict]:
         print(f"  Extracted {len(athletes)} athletes from page {page}")
         return athletes
         
-    except requests.RequestException as e:
+    except (requests.RequestException, etree.ParserError) as e:
         print(f"  Error fetching page {page}: {e}")
         return []
 
@@ -269,8 +504,6 @@ def scrape_all_rankings(gender: str, limit: int = 100, start_rank: int = 1) -> L
             all_athletes = all_athletes[:limit]
             break
         
-        # Be polite to the server
-        time.sleep(DELAY_BETWEEN_REQUESTS)
         page += 1
     
     print(f"Total extracted: {len(all_athletes)} {gender}")
@@ -303,11 +536,12 @@ def find_dropped_athletes(gender: str, existing_athlete_ids: set, top_100_ids: s
     print(f"  Athletes to find: {sorted(list(dropped_ids)[:10])}{'...' if len(dropped_ids) > 10 else ''}")
     
     found_athletes = []
-    found_ids = set()
+    # IDs still to find; each hit is removed, so the loop ends once it is empty
+    remaining = set(dropped_ids)
     page = 3  # Start after top 100 (pages 1-2 cover top 100)
     max_page = 20  # Reasonable limit (top 1000 athletes)
     
-    while found_ids < dropped_ids and page <= max_page:
+    while remaining and page <= max_page:
         print(f"  Checking page {page}...")
         page_athletes = scrape_rankings_page(gender, page)
         
@@ -318,21 +552,21 @@ def find_dropped_athletes(gender: str, existing_athlete_ids: set, top_100_ids: s
         # Check which athletes on this page are in our dropped list
         for athlete in page_athletes:
             athlete_id = athlete.get('world_athletics_id')
-            if athlete_id and athlete_id in dropped_ids and athlete_id not in found_ids:
+            if athlete_id in remaining:
+                remaining.discard(athlete_id)
                 found_athletes.append(athlete)
-                found_ids.add(athlete_id)
                 print(f"    ✓ Found: {athlete['name']} (rank {athlete.get('rank', 'N/A')})")
+                if not remaining:
+                    break
         
         # Stop if we found everyone
-        if found_ids == dropped_ids:
+        if not remaining:
             print(f"  ✓ Found all {len(dropped_ids)} dropped athletes!")
             break
         
-        # Be polite to the server
-        time.sleep(DELAY_BETWEEN_REQUESTS)
         page += 1
     
-    still_missing = dropped_ids - found_ids
+    still_missing = remaining
     if still_missing:
         print(f"  ⚠️  Could not find {len(still_missing)} athletes (may have dropped out of top 1000)")
         print(f"      Missing IDs: {sorted(list(still_missing)[:5])}{'...' if len(still_missing) > 5 else ''}")
@@ -345,6 +579,48 @@ def find_dropped_athletes(gender: str, existing_athlete_ids: set, top_100_ids: s
 # PART 2: ENRICHING ATHLETE PROFILES
 # ============================================================================
 
+def _slice_next_data(content: bytes) -> Optional[bytes]:
+    """
+    Return the raw __NEXT_DATA__ JSON from a profile page, or None.
+    
+    The tag is a fixed literal, so plain byte searches find it without
+    decoding the page or running a regex over it.
+    """
+    marker = content.find(NEXT_DATA_MARKER)
+    if marker < 0:
+        return None
+    start = content.find(b'>', marker) + 1
+    end = content.find(SCRIPT_END, start)
+    if start == 0 or end < 0:
+        return None
+    return content[start:end]
+
+
+def _parse_birth_date(value: str) -> Optional[date]:
+    """
+    Parse a profile birth date in either ISO (YYYY-MM-DD) or WA (DD MMM YYYY) form.
+    
+    date.fromisoformat and a month lookup avoid strptime, which recompiles
+    its format and consults the locale on every call.
+    
+    Returns None if the value matches neither format.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    match = _WA_BIRTH_DATE_RE.match(value.strip())
+    if match:
+        day, month, year = match.groups()
+        month_number = _MONTHS.get(month.lower())
+        if month_number:
+            try:
+                return date(int(year), month_number, int(day))
+            except ValueError:
+                pass
+    return None
+
+
 def fetch_athlete_profile(athlete_id: str, profile_url: str, name: str, gender: str = 'men') -> Optional[Dict]:
     """
     Fetch detailed athlete data from their profile page.
@@ -359,28 +635,33 @@ def fetch_athlete_profile(athlete_id: str, profile_url: str, name: str, gender:
     - Age
     - Sponsor (if available)
     """
+    # Be very polite when fetching profiles
+    PROFILE_RATE_LIMITER.wait()
     print(f"  Fetching profile: {name} ({athlete_id})...")
     
     try:
-        response = requests.get(profile_url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        html = response.text
-        
-        # Extract data from __NEXT_DATA__ JSON embedded in page
-        json_match = re.search(r'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>', html)
-        
-        if not json_match:
+        # Stream the page, keeping it only up to the end of __NEXT_DATA__ (the
+        # tail is drained, not buffered, so the connection returns to the pool)
+        with SESSION.get(profile_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            content = read_until_next_data(response)
+            encoding = response.encoding or 'utf-8'
+        
+        # Extract data from __NEXT_DATA__ JSON embedded in page; the page is
+        # only decoded to text if we have to fall back to scraping it
+        next_data_json = _slice_next_data(content)
+        
+        if next_data_json is None:
             print(f"    ⚠️  No __NEXT_DATA__ found, trying fallback methods")
-            return fetch_profile_fallback(athlete_id, html, name, gender)
+            return fetch_profile_fallback(athlete_id, content.decode(encoding, 'replace'), name, gender)
         
         try:
-            next_data = json.loads(json_match.group(1))
+            next_data = _json_loads(next_data_json)
             competitor = next_data.get('props', {}).get('pageProps', {}).get('competitor', {})
             
             if not competitor:
                 print(f"    ⚠️  No competitor data found")
-                return fetch_profile_fallback(athlete_id, html, name, gender)
+                return fetch_profile_fallback(athlete_id, content.decode(encoding, 'replace'), name, gender)
             
             # Extract all available data
             result = {
@@ -437,19 +718,17 @@ def fetch_athlete_profile(athlete_id: str, profile_url: str, name: str, gender:
             if basic_info.get('birthDate'):
                 # Calculate age - handle multiple date formats
                 birth_date_str = basic_info['birthDate']
-                try:
-                    # Try ISO format first (YYYY-MM-DD)
-                    birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d')
-                except ValueError:
-                    try:
-                        # Try World Athletics format (DD MMM YYYY)
-                        birth_date = datetime.strptime(birth_date_str, '%d %b %Y')
-                    except ValueError:
-                        print(f"    ⚠️  Could not parse birth date: {birth_date_str}")
-                        birth_date = None
+                birth_date = _parse_birth_date(birth_date_str)
+                if birth_date is None:
+                    print(f"    ⚠️  Could not parse birth date: {birth_date_str}")
                 
                 if birth_date:
-                    age = (datetime.now() - birth_date).days // 365
+                    # Whole years, minus one if this year's birthday is still
+                    # ahead (days // 365 drifts by a day per leap year)
+                    today = date.today()
+                    age = today.year - birth_date.year - (
+                        (today.month, today.day) < (birth_date.month, birth_date.day)
+                    )
                     result['age'] = age
                     result['date_of_birth'] = birth_date.strftime('%Y-%m-%d')
                     print(f"    ✓ Age: {age}")
@@ -459,9 +738,9 @@ def fetch_athlete_profile(athlete_id: str, profile_url: str, name: str, gender:
             
             return result
             
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             print(f"    ❌ Failed to parse JSON: {e}")
-            return fetch_profile_fallback(athlete_id, html, name, gender)
+            return fetch_profile_fallback(athlete_id, content.decode(encoding, 'replace'), name, gender)
     
     except requests.RequestException as e:
         print(f"    ❌ Error fetching profile: {e}")
@@ -487,12 +766,12 @@ def fetch_profile_fallback(athlete_id: str, html: str, name: str, gender: str =
         print(f"    ⚠️  WA headshot unavailable - using placeholder (fallback)")
     
     # Try to extract rankings from HTML text
-    marathon_rank_match = re.search(r'#(\d+)\s+(?:Man\'s|Woman\'s)\s+marathon', html, re.IGNORECASE)
+    marathon_rank_match = _MARATHON_RANK_RE.search(html)
     if marathon_rank_match:
         result['marathon_rank'] = int(marathon_rank_match.group(1))
         print(f"    ✓ Marathon rank (fallback): #{marathon_rank_match.group(1)}")
     
-    road_rank_match = re.search(r'#(\d+)\s+(?:Man\'s|Woman\'s)\s+road\s+running', html, re.IGNORECASE)
+    road_rank_match = _ROAD_RUNNING_RANK_RE.search(html)
     if road_rank_match:
         result['road_running_rank'] = int(road_rank_match.group(1))
         print(f"    ✓ Road Running rank (fallback): #{road_rank_match.group(1)}")
@@ -526,26 +805,24 @@ def enrich_athletes(athletes: List[Dict], existing_athletes: Dict[str, Dict] = N
         existing_athletes = {}
     
     enriched = []
+    to_fetch = []
+    headshot_checks = []  # (athlete, WA headshot URL, placeholder to keep)
     skipped_count = 0
     enriched_count = 0
     
-    # Detect how many athletes will need enrichment (quick scan)
-    athletes_needing_enrichment = []
-    for athlete in athletes:
-        wa_id = athlete.get('world_athletics_id')
-        existing = existing_athletes.get(wa_id)
-        
-        needs_enrichment = (
-            force_update or 
-            not existing or 
-            existing.get('world_athletics_marathon_ranking_score') != athlete.get('world_athletics_marathon_ranking_score')
+    # Detect which athletes will need enrichment (quick scan), keyed by WA ID
+    needs_enrichment = {
+        athlete['world_athletics_id']: athlete
+        for athlete in athletes
+        if athlete.get('world_athletics_id') and (
+            force_update
+            or (existing := existing_athletes.get(athlete['world_athletics_id'])) is None
+            or existing.get('world_athletics_marathon_ranking_score') != athlete.get('world_athletics_marathon_ranking_score')
         )
-        
-        if needs_enrichment:
-            athletes_needing_enrichment.append(athlete)
+    }
     
     # Apply batching if too many athletes need enrichment
-    total_needing_enrichment = len(athletes_needing_enrichment)
+    total_needing_enrichment = len(needs_enrichment)
     if not force_update and total_needing_enrichment > MAX_ENRICHMENTS_PER_RUN:
         print(f"\n⚠️  BATCHING ENABLED:")
         print(f"   {total_needing_enrichment} athletes need enrichment (limit: {MAX_ENRICHMENTS_PER_RUN})")
@@ -554,13 +831,11 @@ def enrich_athletes(athletes: List[Dict], existing_athletes: Dict[str, Dict] = N
         
         # Prioritize elite athletes first (lower rank numbers = better ranking)
         # Rank 1-10 processed before rank 100-200 to ensure top athletes stay current
-        athletes_needing_enrichment.sort(
+        batch = sorted(
+            needs_enrichment.values(),
             key=lambda a: a.get('rank', 999)  # Default to 999 for athletes without rank
-        )
-        athletes_needing_enrichment = athletes_needing_enrichment[:MAX_ENRICHMENTS_PER_RUN]
-        
-        # Convert back to set for faster lookup
-        athletes_to_enrich_ids = {a.get('world_athletics_id') for a in athletes_needing_enrichment}
+        )[:MAX_ENRICHMENTS_PER_RUN]
+        athletes_to_enrich_ids = {a['world_athletics_id'] for a in batch}
     else:
         athletes_to_enrich_ids = None  # Enrich all that need it
     
@@ -599,16 +874,10 @@ def enrich_athletes(athletes: List[Dict], existing_athletes: Dict[str, Dict] = N
                 is_placeholder = '/images/' in existing_headshot
                 
                 if is_placeholder and athlete.get('world_athletics_id'):
-                    # Try to restore World Athletics URL
+                    # Try to restore World Athletics URL (tested in bulk below)
                     wa_url = f"https://media.aws.iaaf.org/athletes/{athlete['world_athletics_id']}.jpg"
-                    print(f"  🔄 Testing if WA headshot is now available...")
-                    
-                    if test_image_accessible(wa_url):
-                        print(f"  ✅ WA headshot restored: {wa_url}")
-                        athlete['headshot_url'] = wa_url
-                    else:
-                        print(f"  ⏸️  WA headshot still unavailable - keeping placeholder")
-                        athlete['headshot_url'] = existing_headshot
+                    headshot_checks.append((athlete, wa_url, existing_headshot))
+                    athlete['headshot_url'] = existing_headshot
                 else:
                     # Use existing headshot URL as-is
                     athlete['headshot_url'] = existing_headshot
@@ -635,23 +904,45 @@ def enrich_athletes(athletes: List[Dict], existing_athletes: Dict[str, Dict] = N
                 skipped_count += 1
                 continue
         
-        profile_data = fetch_athlete_profile(
-            athlete['world_athletics_id'],
-            athlete['profile_url'],
-            athlete['name'],
-            athlete.get('gender', 'men')
-        )
-        
-        if profile_data:
-            # Merge profile data into athlete data
-            athlete.update(profile_data)
-            enriched_count += 1
-        
+        # Queue the profile fetch; the athlete dict is filled in place below
+        to_fetch.append(athlete)
         enriched.append(athlete)
-        
-        # Be very polite when fetching profiles
-        if i < len(athletes):
-            time.sleep(DELAY_BETWEEN_PROFILES)
+    
+    # Test whether placeholder headshots can be restored, all at once
+    if headshot_checks:
+        print(f"\n🔄 Testing if {len(headshot_checks)} WA headshots are now available...")
+        accessible = test_images_bulk([wa_url for _, wa_url, _ in headshot_checks])
+        for athlete, wa_url, _ in headshot_checks:
+            if accessible[wa_url]:
+                print(f"  ✅ WA headshot restored for {athlete['name']}: {wa_url}")
+                athlete['headshot_url'] = wa_url
+        restored = sum(accessible[wa_url] for _, wa_url, _ in headshot_checks)
+        print(f"  ⏸️  {len(headshot_checks) - restored} still unavailable - keeping placeholders")
+    
+    # Profile fetches are I/O bound, so run a few at once. PROFILE_RATE_LIMITER
+    # still spaces out the requests themselves.
+    if to_fetch:
+        # Probe the new profiles' headshots in one concurrent batch first, so
+        # fetch_athlete_profile gets a remembered answer instead of a second
+        # blocking request in the middle of each profile
+        test_images_bulk([f"https://media.aws.iaaf.org/athletes/{a['world_athletics_id']}.jpg" for a in to_fetch])
+        
+        print(f"\n🌐 Fetching {len(to_fetch)} profiles ({FETCH_WORKERS} at a time)...")
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            profiles = executor.map(
+                lambda a: fetch_athlete_profile(
+                    a['world_athletics_id'],
+                    a['profile_url'],
+                    a['name'],
+                    a.get('gender', 'men')
+                ),
+                to_fetch
+            )
+            for athlete, profile_data in zip(to_fetch, profiles):
+                if profile_data:
+                    # Merge profile data into athlete data
+                    athlete.update(profile_data)
+                    enriched_count += 1
     
     print(f"\n✅ Enrichment complete:")
     print(f"   Fetched profiles: {enriched_count}")
@@ -696,15 +987,19 @@ def enrich_with_progression_data(
     successful_count = 0
     failed_count = 0
     
-    for i, athlete in enumerate(athletes, 1):
+    def fetch_one(item: Tuple[int, Dict]):
+        """Fetch and save one athlete's progression: (counts), None if skipped, or the error."""
+        i, athlete = item
         wa_id = athlete.get('world_athletics_id')
         db_id = athlete.get('db_id')
         name = athlete.get('name', 'Unknown')
         
         if not wa_id or not db_id:
             print(f"\n[{i}/{len(athletes)}] ⏭️  Skipping {name} - missing ID")
-            continue
+            return None
         
+        # Be polite - space out progression fetches
+        PROGRESSION_RATE_LIMITER.wait()
         print(f"\n[{i}/{len(athletes)}] Fetching progression for {name} (WA_ID: {wa_id})...")
         
         try:
@@ -714,18 +1009,24 @@ def enrich_with_progression_data(
                 disciplines_filter=["Marathon", "Half Marathon"],
                 save_to_db=True
             )
+            return prog_saved, results_saved
+        except Exception as e:
+            print(f"  ❌ Error: {e}")
+            return e
+    
+    # Each fetch saves through its own DB connection, so they can run side by side
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        for outcome in executor.map(fetch_one, enumerate(athletes, 1)):
+            if outcome is None:
+                continue
+            if isinstance(outcome, Exception):
+                failed_count += 1
+                continue
             
+            prog_saved, results_saved = outcome
             total_progression += prog_saved
             total_results += results_saved
             successful_count += 1
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            failed_count += 1
-        
-        # Be polite - delay before next fetch
-        if i < len(athletes):
-            time.sleep(2)
     
     print(f"\n✅ Progression enrichment complete:")
     print(f"   Successful: {successful_count}")
@@ -753,18 +1054,21 @@ def reset_athletes_sequence(conn):
     which can cause "duplicate key" errors on subsequent inserts.
     """
     with conn.cursor() as cur:
-        # Get the current max ID
-        cur.execute("SELECT MAX(id) FROM athletes")
-        max_id = cur.fetchone()[0]
+        # Read the max ID and move the sequence in one statement (no client
+        # round trip between the two); GREATEST never moves the sequence back
+        cur.execute("""
+            SELECT MAX(id),
+                   CASE WHEN MAX(id) IS NOT NULL THEN
+                       setval('athletes_id_seq', GREATEST(MAX(id), (SELECT last_value FROM athletes_id_seq)), true)
+                   END
+            FROM athletes
+        """)
+        max_id, new_val = cur.fetchone()
         
         if max_id is None:
             print("   No existing athletes found, sequence is fine")
             return
         
-        # Reset the sequence to max_id + 1
-        cur.execute(f"SELECT setval('athletes_id_seq', {max_id}, true)")
-        new_val = cur.fetchone()[0]
-        
         print(f"   ✓ Reset athletes_id_seq to {new_val} (max existing ID: {max_id})")
 
 
@@ -795,61 +1099,89 @@ def run_migration(conn):
             print(f"⚠️  Schema check warning (fields may already exist): {e}")
 
 
+# Fields that matter for updates, in the fixed order compute_hash joins them
+HASHED_FIELDS = (
+    'name', 'country', 'gender', 'personal_best', 'season_best',
+    'marathon_rank', 'road_running_rank', 'overall_rank', 'age',
+    'dob', 'date_of_birth',
+)
+
+
 def compute_hash(athlete: Dict) -> str:
     """
-    Compute SHA256 hash of athlete data for change detection.
+    Compute a BLAKE2b digest of athlete data for change detection.
     
     Only includes fields that matter for updates (not rank or points).
+    The values are joined in a fixed order rather than JSON-encoded; this
+    only needs to detect changes, not resist tampering.
     """
-    # Convert date objects to strings for JSON serialization
-    dob = athlete.get('dob')
-    if dob and not isinstance(dob, str):
-        dob = str(dob)
-    
-    date_of_birth = athlete.get('date_of_birth')
-    if date_of_birth and not isinstance(date_of_birth, str):
-        date_of_birth = str(date_of_birth)
-    
-    relevant_fields = {
-        'name': athlete.get('name'),
-        'country': athlete.get('country'),
-        'gender': athlete.get('gender'),
-        'personal_best': athlete.get('personal_best'),
-        'season_best': athlete.get('season_best'),
-        'marathon_rank': athlete.get('marathon_rank'),
-        'road_running_rank': athlete.get('road_running_rank'),
-        'overall_rank': athlete.get('overall_rank'),
-        'age': athlete.get('age'),
-        'dob': dob,
-        'date_of_birth': date_of_birth,
-    }
+    # str() also covers date objects loaded from the database; the unit
+    # separator can't appear in any of these values
+    values = map(athlete.get, HASHED_FIELDS)
+    data_str = '\x1f'.join('' if value is None else str(value) for value in values)
+    return hashlib.blake2b(data_str.encode(), digest_size=16, usedforsecurity=False).hexdigest()
+
+
+
+# Length of the hex SHA-256 digests data_hash held before compute_hash moved
+# to BLAKE2b (32 hex chars); rows still carrying one are compared with
+# _legacy_compute_hash so the format change alone doesn't mark them changed
+LEGACY_HASH_LENGTH = 64
+
+
+def _legacy_compute_hash(athlete: Dict) -> str:
+    """
+    Compute the old SHA-256-over-JSON data_hash for an athlete.
     
-    # Sort keys for consistency
+    Only used to compare against hashes stored before the BLAKE2b switch.
+    Such a row keeps its old hash until the athlete really changes; the
+    upsert then stores the new format.
+    """
+    relevant_fields = {field: athlete.get(field) for field in HASHED_FIELDS}
+    # Date objects were stringified for JSON serialization
+    for field in ('dob', 'date_of_birth'):
+        value = relevant_fields[field]
+        if value and not isinstance(value, str):
+            relevant_fields[field] = str(value)
     data_str = json.dumps(relevant_fields, sort_keys=True)
     return hashlib.sha256(data_str.encode()).hexdigest()
 
+# Columns of existing athletes that enrichment, change detection and the
+# dropped-athlete search actually read
+EXISTING_ATHLETE_COLUMNS = (
+    'id', 'world_athletics_id', 'gender',
+    'personal_best', 'season_best', 'headshot_url',
+    'marathon_rank', 'road_running_rank', 'overall_rank',
+    'age', 'date_of_birth', 'sponsor', 'data_hash',
+    'world_athletics_marathon_ranking_score',
+)
+# All that detect_changes and the dropped-athlete search read; enough when
+# enrichment is skipped and no cached profile data gets copied over
+CHANGE_DETECTION_COLUMNS = ('id', 'world_athletics_id', 'gender', 'data_hash')
+
 
-def fetch_existing_athletes(conn) -> Dict[str, Dict]:
+def fetch_existing_athletes(conn, columns: Tuple[str, ...] = EXISTING_ATHLETE_COLUMNS) -> Dict[str, Dict]:
     """
     Fetch all existing athletes from database.
     
+    Only the given columns are selected (EXISTING_ATHLETE_COLUMNS by default,
+    which is what enrich_athletes needs); must include world_athletics_id.
+    
     Returns dict keyed by world_athletics_id.
     """
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute("""
-            SELECT 
-                id, world_athletics_id, name, country, gender,
-                personal_best, season_best, headshot_url,
-                marathon_rank, road_running_rank, overall_rank,
-                age, date_of_birth, sponsor, data_hash,
-                last_fetched_at, ranking_source, world_athletics_marathon_ranking_score
+    with conn.cursor() as cur:
+        cur.execute(f"""
+            SELECT {', '.join(columns)}
             FROM athletes
             WHERE world_athletics_id IS NOT NULL
         """)
         
+        # Plain tuples zipped straight into one dict per row, rather than
+        # RealDictCursor rows that then get copied into dicts
         athletes = {}
-        for row in cur.fetchall():
-            athletes[row['world_athletics_id']] = dict(row)
+        for row in cur:
+            athlete = dict(zip(columns, row))
+            athletes[athlete['world_athletics_id']] = athlete
         
         return athletes
 
@@ -877,15 +1209,19 @@ def detect_changes(extracted_athletes: List[Dict], existing_athletes: Dict[str,
             continue
         
         new_hash = compute_hash(athlete)
+        existing = existing_athletes.get(wa_id)
         
-        if wa_id not in existing_athletes:
+        if existing is None:
             athlete['data_hash'] = new_hash
             new_athletes.append(athlete)
         else:
-            existing = existing_athletes[wa_id]
             old_hash = existing.get('data_hash')
+            if old_hash is not None and len(old_hash) == LEGACY_HASH_LENGTH:
+                unchanged = old_hash == _legacy_compute_hash(athlete)
+            else:
+                unchanged = old_hash == new_hash
             
-            if force_update or old_hash != new_hash:
+            if force_update or not unchanged:
                 athlete['data_hash'] = new_hash
                 athlete['db_id'] = existing['id']
                 changed_athletes.append(athlete)
@@ -977,6 +1313,70 @@ def upsert_athlete(conn, athlete: Dict, is_update: bool = False) -> int:
             return cur.fetchone()[0]
 
 
+# Athlete dict keys in the column order of upsert_athletes' INSERT
+UPSERT_FIELDS = (
+    'name', 'country', 'gender', 'personal_best', 'season_best',
+    'headshot_url', 'world_athletics_id', 'profile_url',
+    'marathon_rank', 'road_running_rank', 'overall_rank',
+    'age', 'date_of_birth', 'world_athletics_marathon_ranking_score', 'data_hash',
+)
+
+
+def upsert_athletes(conn, athletes: List[Dict]) -> Dict[str, int]:
+    """
+    Insert or update many athletes in one INSERT ... ON CONFLICT statement.
+    
+    New and changed athletes go through the same statement, keyed on the
+    unique world_athletics_id; execute_values sends all the rows in a single
+    round trip instead of one per athlete.
+    
+    Returns:
+        Dict mapping world_athletics_id to database ID
+    """
+    # A statement can't update the same row twice, so keep one row per WA ID
+    unique_athletes = {athlete.get('world_athletics_id'): athlete for athlete in athletes}
+    if not unique_athletes:
+        return {}
+    
+    rows = [tuple(map(athlete.get, UPSERT_FIELDS)) for athlete in unique_athletes.values()]
+    
+    with conn.cursor() as cur:
+        returned = execute_values(cur, """
+            INSERT INTO athletes (
+                name, country, gender, personal_best, season_best,
+                headshot_url, world_athletics_id, world_athletics_profile_url,
+                marathon_rank, road_running_rank, overall_rank,
+                age, date_of_birth, world_athletics_marathon_ranking_score, data_hash,
+                last_fetched_at, ranking_source
+            ) VALUES %s
+            ON CONFLICT (world_athletics_id) DO UPDATE SET
+                name = EXCLUDED.name,
+                country = EXCLUDED.country,
+                gender = EXCLUDED.gender,
+                personal_best = EXCLUDED.personal_best,
+                season_best = EXCLUDED.season_best,
+                headshot_url = EXCLUDED.headshot_url,
+                world_athletics_profile_url = EXCLUDED.world_athletics_profile_url,
+                marathon_rank = EXCLUDED.marathon_rank,
+                road_running_rank = EXCLUDED.road_running_rank,
+                overall_rank = EXCLUDED.overall_rank,
+                age = EXCLUDED.age,
+                date_of_birth = EXCLUDED.date_of_birth,
+                world_athletics_marathon_ranking_score = EXCLUDED.world_athletics_marathon_ranking_score,
+                data_hash = EXCLUDED.data_hash,
+                last_fetched_at = NOW(),
+                ranking_source = 'world_rankings',
+                updated_at = NOW()
+            RETURNING id, world_athletics_id
+        """, rows,
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), 'world_rankings')",
+            page_size=len(rows),  # one statement for the whole sync (a few hundred rows)
+            fetch=True
+        )
+        
+        return {wa_id: db_id for db_id, wa_id in returned}
+
+
 def sync_to_database(
     new_athletes: List[Dict],
     changed_athletes: List[Dict],
@@ -1035,18 +1435,15 @@ def sync_to_database(
         
         print("\n💾 Applying changes to database...")
         
-        # Insert new athletes and collect their IDs
         for i, athlete in enumerate(new_athletes, 1):
             print(f"   [{i}/{len(new_athletes)}] Adding {athlete['name']}")
-            db_id = upsert_athlete(conn, athlete, is_update=False)
-            athlete['db_id'] = db_id  # Store for progression fetch
-            athletes_to_enrich.append(athlete)
-        
-        # Update changed athletes
         for i, athlete in enumerate(changed_athletes, 1):
             print(f"   [{i}/{len(changed_athletes)}] Updating {athlete['name']}")
-            db_id = upsert_athlete(conn, athlete, is_update=True)
-            athlete['db_id'] = db_id  # Store for progression fetch
+        
+        # Insert new and update changed athletes in one batched upsert
+        db_ids = upsert_athletes(conn, new_athletes + changed_athletes)
+        for athlete in new_athletes + changed_athletes:
+            athlete['db_id'] = db_ids.get(athlete['world_athletics_id'])  # Store for progression fetch
             athletes_to_enrich.append(athlete)
         
         conn.commit()
@@ -1101,12 +1498,10 @@ def sync_single_athlete(athlete_id: str, dry_run: bool = False):
         # Construct profile URL if not available
         profile_url = athlete['world_athletics_profile_url']
         if not profile_url:
-            # We need to construct it - but we need the country code
-            # Try to get it from the athlete's record
-            cursor.execute("SELECT country FROM athletes WHERE id = %s", (athlete['id'],))
-            country_result = cursor.fetchone()
-            if country_result and country_result['country']:
-                country = country_result['country'].lower()
+            # We need to construct it from the country code already loaded
+            # with the athlete's record
+            if athlete['country']:
+                country = athlete['country'].lower()
                 name_slug = athlete['name'].lower().replace(' ', '-')
                 profile_url = f"{BASE_URL}/athletes/{country}/{name_slug}-{athlete_id}"
                 print(f"  Constructed profile URL: {profile_url}")
@@ -1146,13 +1541,10 @@ def sync_single_athlete(athlete_id: str, dry_run: bool = False):
             
             print(f"✓ Successfully updated {athlete['name']}")
             
-            # Fetch and display updated data
-            cursor.execute("""
-                SELECT personal_best, marathon_rank, road_running_rank, age, season_best
-                FROM athletes
-                WHERE id = %s
-            """, (athlete['id'],))
-            updated_athlete = cursor.fetchone()
+            # Display the values just written (no need to read the row back)
+            updated_athlete = {field: update_data.get(field) for field in (
+                'personal_best', 'marathon_rank', 'road_running_rank', 'age', 'season_best'
+            )}
             
             print(f"\n📊 Updated data:")
             print(f"   Personal Best: {updated_athlete['personal_best'] or 'N/A'}")
@@ -1171,6 +1563,8 @@ def sync_single_athlete(athlete_id: str, dry_run: bool = False):
 # ============================================================================
 
 def main():
+    global FETCH_WORKERS, VERBOSE
+    
     parser = argparse.ArgumentParser(
         description='Sync top marathon athletes from World Athletics to database'
     )
@@ -1217,9 +1611,37 @@ def main():
         action='store_true',
         help='Skip fetching progression and race results data (faster)'
     )
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=1 / DELAY_BETWEEN_REQUESTS,
+        help=f'Maximum rankings page requests per second (default: {1 / DELAY_BETWEEN_REQUESTS})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=FETCH_WORKERS,
+        help=f'Profile/progression pages fetched at once (default: {FETCH_WORKERS})'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print every athlete row scraped from the rankings pages'
+    )
     
     args = parser.parse_args()
     
+    if args.rate <= 0:
+        print("Error: --rate must be greater than 0")
+        return 1
+    RANKINGS_RATE_LIMITER.min_interval = 1 / args.rate
+    
+    if args.workers < 1:
+        print("Error: --workers must be at least 1")
+        return 1
+    FETCH_WORKERS = args.workers
+    VERBOSE = args.verbose
+    
     # Special mode: sync single athlete
     if args.athlete_id:
         print("=" * 70)
@@ -1268,9 +1690,13 @@ def main():
     print("\n📥 STEP 1: EXTRACTING RANKINGS")
     print("=" * 70)
     
-    men = scrape_all_rankings('men', limit=limit_per_gender, start_rank=start_rank)
-    time.sleep(DELAY_BETWEEN_REQUESTS)
-    women = scrape_all_rankings('women', limit=limit_per_gender, start_rank=start_rank)
+    # The two lists are independent, so scrape them side by side; the shared
+    # RANKINGS_RATE_LIMITER keeps the combined request rate unchanged
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        men_future = executor.submit(scrape_all_rankings, 'men', limit=limit_per_gender, start_rank=start_rank)
+        women_future = executor.submit(scrape_all_rankings, 'women', limit=limit_per_gender, start_rank=start_rank)
+        men = men_future.result()
+        women = women_future.result()
     
     all_athletes = men + women
     print(f"\n✓ Extracted {len(all_athletes)} total athletes ({len(men)} men, {len(women)} women)")
@@ -1284,7 +1710,9 @@ def main():
         # Run migration first to ensure columns exist
         run_migration(conn)
         
-        existing_athletes = fetch_existing_athletes(conn)
+        existing_athletes = fetch_existing_athletes(
+            conn, CHANGE_DETECTION_COLUMNS if args.skip_enrichment else EXISTING_ATHLETE_COLUMNS
+        )
         print(f"Found {len(existing_athletes)} existing athletes in database")
     finally:
         conn.close()
@@ -1306,7 +1734,6 @@ def main():
         
         # Find dropped athletes beyond top 100
         dropped_men = find_dropped_athletes('men', existing_men_ids, top_100_men_ids)
-        time.sleep(DELAY_BETWEEN_REQUESTS)
         dropped_women = find_dropped_athletes('women', existing_women_ids, top_100_women_ids)
         
         # Add dropped athletes to the processing list
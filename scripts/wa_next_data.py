@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading the __NEXT_DATA__ payload of World Athletics pages.
+
+Profile pages embed everything the scripts parse in a
+<script id="__NEXT_DATA__"> block. Both extract_athlete_progression.py and
+sync_athletes_from_rankings.py stream those pages through
+read_until_next_data().
+"""
+
+import requests
+
+# The <script id="__NEXT_DATA__"> tag holding a page's JSON payload
+NEXT_DATA_MARKER = b'id="__NEXT_DATA__"'
+SCRIPT_END = b'</script>'
+STREAM_CHUNK_SIZE = 16384  # Bytes read at a time while streaming a page
+
+
+def read_until_next_data(response: requests.Response) -> bytes:
+    """
+    Read a streamed response, keeping it only as far as the closing __NEXT_DATA__ tag.
+
+    Everything we parse lives in that script block, so the rest of the page
+    is read to EOF and discarded rather than buffered. Reading to EOF (only a
+    few KB past the tag, which sits near the end of the page) lets the
+    keep-alive connection go back to the session's pool; closing the response
+    early would drop it and cost a fresh TCP+TLS handshake on the next fetch.
+    Falls back to the full body if the marker is missing.
+
+    Args:
+        response: Response from a request made with stream=True
+
+    Returns:
+        Page bytes up to and including the closing </script> of __NEXT_DATA__
+    """
+    buf = bytearray()
+    marker_pos = -1
+    chunks = response.iter_content(STREAM_CHUNK_SIZE)
+    for chunk in chunks:
+        prev_len = len(buf)
+        buf += chunk
+        if marker_pos < 0:
+            # Only rescan the overlap with the previous chunk, not the whole buffer
+            marker_pos = buf.find(NEXT_DATA_MARKER, max(0, prev_len - len(NEXT_DATA_MARKER)))
+            if marker_pos < 0:
+                continue
+        if buf.find(SCRIPT_END, max(marker_pos, prev_len - len(SCRIPT_END))) >= 0:
+            break
+    # Drain the tail so the connection is released back to the pool
+    for _ in chunks:
+        pass
+    return bytes(buf)
@@ -0,0 +1,61 @@
+"""
+Tests for the rate-limit detection in scripts/enrich-missing-wa-ids.py.
+
+Run with: python -m unittest tests/test_enrich_missing_wa_ids.py
+(skipped unless the script's own dependencies are installed)
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / 'scripts' / 'enrich-missing-wa-ids.py'
+
+try:
+    import requests  # noqa: F401
+    import lxml  # noqa: F401
+    import dotenv  # noqa: F401
+    DEPS_AVAILABLE = True
+except ImportError:
+    DEPS_AVAILABLE = False
+
+
+def load_script():
+    """Import the hyphenated script as a module"""
+    spec = importlib.util.spec_from_file_location('enrich_missing_wa_ids', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def fake_response(status_code, text):
+    return SimpleNamespace(status_code=status_code, ok=200 <= status_code < 400, text=text)
+
+
+@unittest.skipUnless(DEPS_AVAILABLE, 'requires requests, lxml and python-dotenv')
+class IsRateLimitedTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.script = load_script()
+
+    def test_200_no_results_page_mentioning_quota_is_not_throttled(self):
+        page = '<html><script>window.cfg = {"quota": 100}</script><p>No results</p></html>'
+        self.assertFalse(self.script._is_rate_limited(fake_response(200, page)))
+
+    def test_200_results_page_is_not_throttled(self):
+        page = '<a data-athlete-id="14208194">Eliud Kipchoge</a><script>"rate limit"</script>'
+        self.assertFalse(self.script._is_rate_limited(fake_response(200, page)))
+
+    def test_429_is_throttled(self):
+        self.assertTrue(self.script._is_rate_limited(fake_response(429, '')))
+
+    def test_error_status_with_throttle_text_is_throttled(self):
+        self.assertTrue(self.script._is_rate_limited(fake_response(403, 'Too Many Requests')))
+
+    def test_error_status_without_throttle_text_is_not_throttled(self):
+        self.assertFalse(self.script._is_rate_limited(fake_response(404, 'Not found')))
+
+
+if __name__ == '__main__':
+    unittest.main()